@@ -3,11 +3,12 @@ import pygame.gfxdraw
 import sys
 import math
 import time
-import copy
-import threading
 from enum import Enum
 import random
 
+from othello_engine import EMPTY, PLAYER_BLACK, PLAYER_WHITE, POSITION_VALUES, AIService, Difficulty, Othello
+from othello_engine.stats import log_record
+
 # =============================================================================
 # 1.Constants and Setup
 # =============================================================================
@@ -46,171 +47,54 @@ NEON_GREEN = (57, 255, 20)
 DEEP_PURPLE = (75, 0, 130)
 CORAL = (255, 127, 80)
 
-# --- Game Constants ---
-PLAYER_BLACK = 1
-PLAYER_WHITE = -1
-EMPTY = 0
-DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-
 # --- AI Settings ---
-class Difficulty(Enum):
-    EASY = 2
-    MEDIUM = 4
-    HARD = 6
-    EXPERT = 8
-    GRANDMASTER = 10
-
 AI_DIFFICULTY = Difficulty.MEDIUM
-
-# --- Positional Values Matrix ---
-POSITION_VALUES = [
-    [100, -20,  10,   5,   5,  10, -20, 100],
-    [-20, -50,  -2,  -2,  -2,  -2, -50, -20],
-    [ 10,  -2,  -1,  -1,  -1,  -1,  -2,  10],
-    [  5,  -2,  -1,  -1,  -1,  -1,  -2,   5],
-    [  5,  -2,  -1,  -1,  -1,  -1,  -2,   5],
-    [ 10,  -2,  -1,  -1,  -1,  -1,  -2,  10],
-    [-20, -50,  -2,  -2,  -2,  -2, -50, -20],
-    [100, -20,  10,   5,   5,  10, -20, 100]
-]
+AI_WORKERS = 1  # >1 searches root moves in that many processes
+AI_PONDER = True  # search on the human's time in PvB
+AI_MIN_THINK_TIME = 0.5  # seconds, for realism
+AI_STATS_LOG = None  # path of a JSON-lines file to log every AI move's search statistics to
+# The engines of both AI sides run in a worker process, started in main()
+AI_SERVICE = None
 
 # =============================================================================
-# 2.Game Logic Class
+# 2.Game Class (rules live in othello_engine)
 # =============================================================================
 
-class Othello:
+class OthelloGame(Othello):
+    """The engine's Othello plus sounds, animations and AI panel state."""
+
     def __init__(self, sounds):
-        self.board = [[EMPTY for _ in range(8)] for _ in range(8)]
-        self.board[3][3], self.board[4][4] = PLAYER_WHITE, PLAYER_WHITE
-        self.board[3][4], self.board[4][3] = PLAYER_BLACK, PLAYER_BLACK
-        self.current_player = PLAYER_BLACK
-        self.valid_moves = self.get_valid_moves(self.current_player)
+        super().__init__()
         self.ai_decision_log = []
-        self.move_history = []
-        self.game_history = []  # Full game history with timestamps
         self.ai_thinking = False
-        self.last_move = None
-        self.game_over = False
-        self.winner = None
         self.animations = []
         self.hover_pos = None
         self.sounds = sounds
-        self.turn_count = 0
         self.ai_think_time = 0
+        self.ai_stats = None  # search statistics record of the last AI move
         self.evaluation_history = []
-        self.move_start_time = time.time()
-        
-    def copy(self):
-        """Creates a deep copy for AI simulation."""
-        new_game = Othello(sounds={})
-        new_game.board = copy.deepcopy(self.board)
-        new_game.current_player = self.current_player
-        new_game.valid_moves = new_game.get_valid_moves(new_game.current_player)
-        new_game.turn_count = self.turn_count
-        return new_game
-
-    def is_on_board(self, r, c):
-        return 0 <= r < 8 and 0 <= c < 8
-
-    def get_valid_moves(self, player):
-        moves = {}
-        for r in range(8):
-            for c in range(8):
-                if self.board[r][c] == EMPTY:
-                    pieces_to_flip = self._get_pieces_to_flip(r, c, player)
-                    if pieces_to_flip:
-                        moves[(r, c)] = pieces_to_flip
-        return moves
-
-    def _get_pieces_to_flip(self, r, c, player):
-        opponent = -player
-        pieces_to_flip = []
-        for dr, dc in DIRECTIONS:
-            line = []
-            curr_r, curr_c = r + dr, c + dc
-            while self.is_on_board(curr_r, curr_c) and self.board[curr_r][curr_c] == opponent:
-                line.append((curr_r, curr_c))
-                curr_r += dr
-                curr_c += dc
-            if self.is_on_board(curr_r, curr_c) and self.board[curr_r][curr_c] == player:
-                pieces_to_flip.extend(line)
-        return pieces_to_flip
 
     def make_move(self, r, c):
-        if (r, c) in self.valid_moves:
-            # Record move in history
-            move_time = time.time() - self.move_start_time
-            self.game_history.append({
-                'move': (r, c),
-                'player': self.current_player,
-                'turn': self.turn_count,
-                'time': move_time,
-                'board_state': copy.deepcopy(self.board)
+        player = self.current_player
+        pieces_to_flip = self.valid_moves.get((r, c), [])
+        if not super().make_move(r, c):
+            return False
+
+        if self.sounds.get('place'):
+            self.sounds['place'].play()
+
+        for i, piece_pos in enumerate(pieces_to_flip):
+            self.animations.append({
+                'type': 'flip',
+                'pos': piece_pos,
+                'start_time': time.time() + i * 0.03,
+                'duration': 0.3,
+                'from_player': -player,
+                'to_player': player
             })
-            
-            self.move_history.append(copy.deepcopy(self.board))
-            self.board[r][c] = self.current_player
-            self.last_move = (r, c)
-            self.turn_count += 1
-            
-            if self.sounds.get('place'):
-                self.sounds['place'].play()
-            
-            pieces_to_flip = self.valid_moves[(r, c)]
-            for i, piece_pos in enumerate(pieces_to_flip):
-                self.board[piece_pos[0]][piece_pos[1]] = self.current_player
-                self.animations.append({
-                    'type': 'flip',
-                    'pos': piece_pos,
-                    'start_time': time.time() + i * 0.03,
-                    'duration': 0.3,
-                    'from_player': -self.current_player,
-                    'to_player': self.current_player
-                })
-                if self.sounds.get('flip') and i % 3 == 0:
-                    self.sounds['flip'].play()
-
-            self._switch_player()
-            return True
-        return False
-
-    def _switch_player(self):
-        self.current_player *= -1
-        self.valid_moves = self.get_valid_moves(self.current_player)
-        self.move_start_time = time.time()
-        
-        if not self.valid_moves:
-            self.current_player *= -1
-            self.valid_moves = self.get_valid_moves(self.current_player)
-            if not self.valid_moves:
-                self.game_over = True
-                self._determine_winner()
-
-    def get_score(self):
-        black_score = sum(row.count(PLAYER_BLACK) for row in self.board)
-        white_score = sum(row.count(PLAYER_WHITE) for row in self.board)
-        return black_score, white_score
-
-    def _determine_winner(self):
-        black_score, white_score = self.get_score()
-        if black_score > white_score:
-            self.winner = PLAYER_BLACK
-        elif white_score > black_score:
-            self.winner = PLAYER_WHITE
-        else:
-            self.winner = EMPTY
-
-    def get_mobility_score(self, player):
-        return len(self.get_valid_moves(player))
-
-    def get_corner_score(self, player):
-        corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-        return sum(1 for r, c in corners if self.board[r][c] == player)
-
-    def get_edge_score(self, player):
-        edges = [(i, 0) for i in range(8)] + [(i, 7) for i in range(8)] + \
-                [(0, i) for i in range(1, 7)] + [(7, i) for i in range(1, 7)]
-        return sum(1 for r, c in edges if self.board[r][c] == player)
+            if self.sounds.get('flip') and i % 3 == 0:
+                self.sounds['flip'].play()
+        return True
 
     def draw(self, win, font, small_font, game_mode):
         self._draw_enhanced_board(win)
@@ -243,8 +127,8 @@ class Othello:
             ("Black Score:", str(black_score)),
             ("White Score:", str(white_score)),
             ("", ""),
-            ("Black Mobility:", str(len(self.get_valid_moves(PLAYER_BLACK)))),
-            ("White Mobility:", str(len(self.get_valid_moves(PLAYER_WHITE)))),
+            ("Black Mobility:", str(self.get_mobility_score(PLAYER_BLACK))),
+            ("White Mobility:", str(self.get_mobility_score(PLAYER_WHITE))),
             ("", ""),
             ("Black Corners:", str(self.get_corner_score(PLAYER_BLACK))),
             ("White Corners:", str(self.get_corner_score(PLAYER_WHITE))),
@@ -453,7 +337,7 @@ class Othello:
         score_text = font.render(f"{black_score}", True, WHITE)
         win.blit(score_text, (BOARD_X + 100, score_y - score_text.get_height() // 2))
         
-        black_mobility = len(self.get_valid_moves(PLAYER_BLACK))
+        black_mobility = self.get_mobility_score(PLAYER_BLACK)
         black_corners = self.get_corner_score(PLAYER_BLACK)
         stats_font = pygame.font.Font(None, 20)
         mobility_text = stats_font.render(f"Moves: {black_mobility}", True, CYAN)
@@ -465,7 +349,7 @@ class Othello:
         score_text = font.render(f"{white_score}", True, WHITE)
         win.blit(score_text, (BOARD_X + BOARD_SIZE - 140, score_y - score_text.get_height() // 2))
         
-        white_mobility = len(self.get_valid_moves(PLAYER_WHITE))
+        white_mobility = self.get_mobility_score(PLAYER_WHITE)
         white_corners = self.get_corner_score(PLAYER_WHITE)
         mobility_text = stats_font.render(f"Moves: {white_mobility}", True, CYAN)
         corner_text = stats_font.render(f"Corners: {white_corners}", True, GOLD)
@@ -516,6 +400,10 @@ class Othello:
             win.blit(status_text, (DEBUG_PANEL_X + 20, BOARD_Y + 70))
         
         y_offset = BOARD_Y + 100
+        table_bottom = BOARD_Y + BOARD_SIZE - 40
+        if self.ai_stats:
+            table_bottom -= 75
+            self._draw_search_stats(win, small_font, table_bottom + 40)
         
         if not self.ai_decision_log:
             if self.ai_thinking:
@@ -537,7 +425,7 @@ class Othello:
         max_score = max(abs(s) for s, m in self.ai_decision_log) if self.ai_decision_log else 1
         
         for i, (score, move) in enumerate(self.ai_decision_log[:15]):
-            if y_offset > BOARD_Y + BOARD_SIZE - 40:
+            if y_offset > table_bottom:
                 break
             
             is_best_move = (i == 0)
@@ -579,6 +467,22 @@ class Othello:
             
             y_offset += 25
 
+    def _draw_search_stats(self, win, small_font, y):
+        stats = self.ai_stats
+        pygame.draw.line(win, DEEP_PURPLE, (DEBUG_PANEL_X + 15, y - 8),
+                         (DEBUG_PANEL_X + DEBUG_PANEL_WIDTH - 15, y - 8), 2)
+        if stats['source'] != 'search':
+            lines = [f"{stats['source'].capitalize()} move, depth {stats['depth']}"]
+        else:
+            lines = [
+                f"Depth {stats['depth']}   Nodes {format_count(stats['nodes'])}   {format_count(stats['nps'])} nps",
+                f"EBF {stats['branching_factor']:.2f}   1st-move cutoffs {stats['first_move_cutoff_rate']:.0%}",
+                f"TT hits {stats['tt_hit_rate']:.0%}   Eval cache {stats['eval_cache_hit_rate']:.0%}"
+                f"   ProbCut {stats['probcut_cuts']}",
+            ]
+        for i, line in enumerate(lines):
+            win.blit(small_font.render(line, True, LIGHT_GRAY), (DEBUG_PANEL_X + 20, y + i * 22))
+
     def draw_statistics_panel(self, win, font, small_font):
         panel_rect = pygame.Rect(STATS_PANEL_X, BOARD_Y, STATS_PANEL_WIDTH, BOARD_SIZE)
         
@@ -610,297 +514,15 @@ class Othello:
 
 
 # =============================================================================
-# 3. Advanced AI
+# 3. Enhanced UI and Game Management
 # =============================================================================
 
-def advanced_evaluate_board(board, player, total_pieces, depth_remaining=0):
-
-    opponent = -player
-    
-    if total_pieces < 20:  # Opening
-        phase_weights = {
-            'piece': 1, 'mobility': 20, 'corner': 150, 'edge': 10,
-            'stability': 100, 'position': 15, 'parity': 5
-        }
-    elif total_pieces < 52:  # Mid-game
-        phase_weights = {
-            'piece': 8, 'mobility': 15, 'corner': 120, 'edge': 15,
-            'stability': 120, 'position': 12, 'parity': 10
-        }
-    else:  # End-game
-        phase_weights = {
-            'piece': 25, 'mobility': 8, 'corner': 140, 'edge': 20,
-            'stability': 140, 'position': 5, 'parity': 30
-        }
-    
-    score = 0
-    
-    # 1. Piece count with parity consideration
-    my_pieces = sum(row.count(player) for row in board)
-    opp_pieces = sum(row.count(opponent) for row in board)
-    piece_diff = my_pieces - opp_pieces
-    
-    # Parity bonus in endgame
-    if total_pieces > 55:
-        remaining_moves = 64 - total_pieces
-        if remaining_moves % 2 == 1:  # Odd number of moves left
-            piece_diff += 0.5  # Slight advantage to current player
-    
-    score += phase_weights['piece'] * piece_diff
-    
-    # 2. Enhanced mobility calculation
-    temp_game = Othello(sounds={})
-    temp_game.board = board
-    my_moves = len(temp_game.get_valid_moves(player))
-    opp_moves = len(temp_game.get_valid_moves(opponent))
-    
-    if my_moves + opp_moves > 0:
-        mobility_ratio = (my_moves - opp_moves) / (my_moves + opp_moves + 1)
-        score += phase_weights['mobility'] * mobility_ratio * 100
-    
-    # Mobility desperation factor
-    if my_moves == 0 and opp_moves > 0:
-        score -= 500  # Very bad position
-    elif opp_moves == 0 and my_moves > 0:
-        score += 500  # Very good position
-    
-    # 3. Corner control with adjacency penalties
-    corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-    corner_adjacencies = [
-        [(0,1), (1,0), (1,1)],  # Adjacent to (0,0)
-        [(0,6), (1,7), (1,6)],  # Adjacent to (0,7)
-        [(6,0), (7,1), (6,1)],  # Adjacent to (7,0)
-        [(6,7), (7,6), (6,6)]   # Adjacent to (7,7)
-    ]
-    
-    my_corners = opp_corners = 0
-    for i, (r, c) in enumerate(corners):
-        if board[r][c] == player:
-            my_corners += 1
-        elif board[r][c] == opponent:
-            opp_corners += 1
-        elif board[r][c] == EMPTY:
-            # Penalty for occupying squares adjacent to empty corners
-            for adj_r, adj_c in corner_adjacencies[i]:
-                if board[adj_r][adj_c] == player:
-                    score -= 25
-                elif board[adj_r][adj_c] == opponent:
-                    score += 25
-    
-    score += phase_weights['corner'] * (my_corners - opp_corners)
-    
-    # 4. Edge control
-    edges = [(i, 0) for i in range(8)] + [(i, 7) for i in range(8)] + \
-            [(0, i) for i in range(1, 7)] + [(7, i) for i in range(1, 7)]
-    
-    my_edges = sum(1 for r, c in edges if board[r][c] == player)
-    opp_edges = sum(1 for r, c in edges if board[r][c] == opponent)
-    score += phase_weights['edge'] * (my_edges - opp_edges)
-    
-    # 5. Advanced stability calculation
-    my_stable = count_advanced_stable_pieces(board, player)
-    opp_stable = count_advanced_stable_pieces(board, opponent)
-    score += phase_weights['stability'] * (my_stable - opp_stable)
-    
-    # 6. Positional values
-    position_score = 0
-    for r in range(8):
-        for c in range(8):
-            if board[r][c] == player:
-                position_score += POSITION_VALUES[r][c]
-            elif board[r][c] == opponent:
-                position_score -= POSITION_VALUES[r][c]
-    score += phase_weights['position'] * position_score
-    
-    # 7. Advanced pattern recognition
-    score += evaluate_patterns(board, player) * 10
-    
-    # 8. Depth bonus for deeper search
-    if depth_remaining > 0:
-        score += depth_remaining * 2
-    
-    return score
-
-def count_advanced_stable_pieces(board, player):
-    stable_count = 0
-    
-    for r in range(8):
-        for c in range(8):
-            if board[r][c] == player:
-                stability_score = 0
-                
-                if (r, c) in [(0, 0), (0, 7), (7, 0), (7, 7)]:
-                    stable_count += 1
-                    continue
-                
-                if r == 0 or r == 7 or c == 0 or c == 7:
-                    edge_stable = True
-                    if r == 0 or r == 7:  # Top/bottom edge
-                        for dc in [-1, 1]:
-                            nc = c + dc
-                            while 0 <= nc < 8:
-                                if board[r][nc] != player:
-                                    edge_stable = False
-                                    break
-                                nc += dc
-                    if c == 0 or c == 7:  # Left/right edge
-                        for dr in [-1, 1]:
-                            nr = r + dr
-                            while 0 <= nr < 8:
-                                if board[nr][c] != player:
-                                    edge_stable = False
-                                    break
-                                nr += dr
-                    if edge_stable:
-                        stability_score += 1
-                
-                # Internal stability (surrounded by own pieces)
-                surrounded = True
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        if dr == 0 and dc == 0:
-                            continue
-                        nr, nc = r + dr, c + dc
-                        if 0 <= nr < 8 and 0 <= nc < 8:
-                            if board[nr][nc] != player:
-                                surrounded = False
-                                break
-                    if not surrounded:
-                        break
-                
-                if surrounded:
-                    stability_score += 0.5
-                
-                stable_count += stability_score
-    
-    return stable_count
-
-def evaluate_patterns(board, player):
-    """Evaluate common Othello patterns."""
-    score = 0
-    opponent = -player
-    
-    # X-square pattern (bad squares next to corners)
-    x_squares = [(1, 1), (1, 6), (6, 1), (6, 6)]
-    corner_pairs = [((0, 0), (1, 1)), ((0, 7), (1, 6)), ((7, 0), (6, 1)), ((7, 7), (6, 6))]
-    
-    for (cr, cc), (xr, xc) in corner_pairs:
-        if board[cr][cc] == EMPTY and board[xr][xc] == player:
-            score -= 20  # Penalty for X-square occupation
-    
-    # C-square pattern (squares adjacent to corners)
-    c_squares = [
-        [(0, 1), (1, 0)],  # Adjacent to (0, 0)
-        [(0, 6), (1, 7)],  # Adjacent to (0, 7)
-        [(6, 0), (7, 1)],  # Adjacent to (7, 0)
-        [(6, 7), (7, 6)]   # Adjacent to (7, 7)
-    ]
-    
-    for i, adjacent_squares in enumerate(c_squares):
-        corner_r, corner_c = [(0, 0), (0, 7), (7, 0), (7, 7)][i]
-        if board[corner_r][corner_c] == EMPTY:
-            for ar, ac in adjacent_squares:
-                if board[ar][ac] == player:
-                    score -= 10 
-    
-    # Wall patterns (edges controlled by one player)
-    for edge in [0, 7]:  # Top and bottom edges
-        edge_control = sum(1 if board[edge][c] == player else -1 if board[edge][c] == opponent else 0 
-                          for c in range(8))
-        if abs(edge_control) > 4:
-            score += edge_control * 5
-    
-    for edge in [0, 7]:  # Left and right edges
-        edge_control = sum(1 if board[r][edge] == player else -1 if board[r][edge] == opponent else 0 
-                          for r in range(8))
-        if abs(edge_control) > 4:
-            score += edge_control * 5
-    
-    return score
-
-def enhanced_minimax_alphabeta(game_state, depth, alpha, beta, maximizing_player, ai_player, total_pieces, start_time, time_limit=10.0):
-    if time.time() - start_time > time_limit:
-        return advanced_evaluate_board(game_state.board, ai_player, total_pieces, depth), None, []
-    
-    if depth == 0 or game_state.game_over:
-        eval_score = advanced_evaluate_board(game_state.board, ai_player, total_pieces, depth)
-        return eval_score, None, []
-
-    valid_moves = game_state.valid_moves
-    if not valid_moves:
-        next_state = game_state.copy()
-        next_state._switch_player()
-        return enhanced_minimax_alphabeta(next_state, depth - 1, alpha, beta, not maximizing_player, 
-                                        ai_player, total_pieces, start_time, time_limit)
-
-    move_scores = []
-    for move in valid_moves:
-        quick_score = 0
-        r, c = move
-        
-        if (r, c) in [(0, 0), (0, 7), (7, 0), (7, 7)]:
-            quick_score += 1000
-        
-        quick_score += len(valid_moves[move]) * 10
-        
-        quick_score += POSITION_VALUES[r][c]
-        
-        move_scores.append((quick_score, move))
-    
-    move_scores.sort(key=lambda x: x[0], reverse=maximizing_player)
-    ordered_moves = [move for _, move in move_scores]
-
-    evaluated_moves = []
-    best_move = ordered_moves[0]
-
-    if maximizing_player:
-        max_eval = -math.inf
-        for move in ordered_moves:
-            if time.time() - start_time > time_limit:
-                break
-            
-            next_state = game_state.copy()
-            next_state.make_move(move[0], move[1])
-            evaluation, _, _ = enhanced_minimax_alphabeta(next_state, depth - 1, alpha, beta, False, 
-                                                       ai_player, total_pieces + 1, start_time, time_limit)
-            evaluated_moves.append((evaluation, move))
-            
-            if evaluation > max_eval:
-                max_eval = evaluation
-                best_move = move
-            
-            alpha = max(alpha, evaluation)
-            if beta <= alpha:
-                break  # Alpha-beta pruning
-        
-        evaluated_moves.sort(key=lambda x: x[0], reverse=True)
-        return max_eval, best_move, evaluated_moves
-    else:
-        min_eval = math.inf
-        for move in ordered_moves:
-            if time.time() - start_time > time_limit:
-                break
-            
-            next_state = game_state.copy()
-            next_state.make_move(move[0], move[1])
-            evaluation, _, _ = enhanced_minimax_alphabeta(next_state, depth - 1, alpha, beta, True, 
-                                                       ai_player, total_pieces + 1, start_time, time_limit)
-            evaluated_moves.append((evaluation, move))
-            
-            if evaluation < min_eval:
-                min_eval = evaluation
-                best_move = move
-            
-            beta = min(beta, evaluation)
-            if beta <= alpha:
-                break  # Alpha-beta pruning
-        
-        evaluated_moves.sort(key=lambda x: x[0])
-        return min_eval, best_move, evaluated_moves
-
-# =============================================================================
-# 4. Enhanced UI and Game Management
-# =============================================================================
+def format_count(n):
+    """1234567 -> '1.23M'."""
+    for limit, suffix in ((1e9, 'G'), (1e6, 'M'), (1e3, 'k')):
+        if n >= limit:
+            return f"{n / limit:.3g}{suffix}"
+    return str(n)
 
 def draw_enhanced_button(win, rect, text, font, button_color, text_color, border_color=None, hover_color=None, icon=None):
     mouse_pos = pygame.mouse.get_pos()
@@ -1073,38 +695,40 @@ def enhanced_main_menu(win, font, big_font):
         pygame.display.flip()
         clock.tick(60)
 
-def enhanced_ai_move_thread(game):
-    try:
-        start_time = time.time()
-        total_pieces = sum(row.count(PLAYER_BLACK) + row.count(PLAYER_WHITE) for row in game.board)
-        
-        time_limits = {
-            Difficulty.EASY: 1.0,
-            Difficulty.MEDIUM: 3.0,
-            Difficulty.HARD: 8.0,
-            Difficulty.EXPERT: 15.0,
-            Difficulty.GRANDMASTER: 30.0
-        }
-        
-        time_limit = time_limits[AI_DIFFICULTY]
-        
-        _, best_move, evaluated_moves = enhanced_minimax_alphabeta(
-            game, AI_DIFFICULTY.value, -math.inf, math.inf, True, 
-            game.current_player, total_pieces, start_time, time_limit
-        )
-        
-        game.ai_decision_log = evaluated_moves
-        game.ai_think_time = time.time() - start_time
-        
-        # Minimum thinking time for realism
-        min_think_time = 0.5
-        if game.ai_think_time < min_think_time:
-            time.sleep(min_think_time - game.ai_think_time)
-        
-        if best_move:
-            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'move': best_move}))
-    except Exception as e:
-        print(f"AI Error: {e}")
+def update_pondering(game, game_mode, human_color):
+    """Keeps the background search running while the human is to move in PvB."""
+    if (AI_PONDER and game_mode == "PvB" and game.current_player == human_color
+            and not game.game_over and game.valid_moves):
+        AI_SERVICE.ponder(game.position, AI_DIFFICULTY)
+
+def stop_pondering():
+    AI_SERVICE.stop_pondering()
+
+def reset_ai_engines():
+    """Forgets everything the engines learned; for a new game."""
+    AI_SERVICE.new_game()
+
+def start_ai_move(game):
+    game.ai_thinking = True
+    AI_SERVICE.request_move(game.position, AI_DIFFICULTY, workers=AI_WORKERS, min_time=AI_MIN_THINK_TIME)
+
+def poll_ai_move(game):
+    """Posts the AI's move as a USEREVENT once the worker has answered."""
+    result = AI_SERVICE.poll()
+    if result is None:
+        return
+    if result.error is not None:
+        print(f"AI Error: {result.error}")
+        return
+    game.ai_decision_log = result.evaluated_moves
+    game.ai_think_time = result.think_time
+    game.ai_stats = result.stats
+    if AI_STATS_LOG and result.stats is not None:
+        log_record(AI_STATS_LOG, dict(result.stats, turn=game.turn_count, player=game.current_player,
+                                      difficulty=AI_DIFFICULTY.name, move=result.best_move,
+                                      think_time=round(result.think_time, 4)))
+    if result.best_move:
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'move': result.best_move}))
 
 def enhanced_game_over_screen(win, font, big_font, winner, final_score, game_stats):
     overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
@@ -1212,6 +836,8 @@ class GameState(Enum):
     PAUSED = 4
 
 def main():
+    global AI_SERVICE
+    AI_SERVICE = AIService()
     pygame.mixer.pre_init(44100, -16, 2, 512)
     pygame.init()
     
@@ -1257,7 +883,7 @@ def main():
                     pass
             
             game_mode, human_color = enhanced_main_menu(win, font, big_font)
-            game = Othello(sounds)
+            game = OthelloGame(sounds)
             game_start_time = time.time()
             game_state = GameState.PLAYING
             
@@ -1271,11 +897,11 @@ def main():
 
             if (game_mode == "BvB") or (game_mode == "PvB" and human_color != game.current_player):
                 if not game.ai_thinking and game.valid_moves:
-                    game.ai_thinking = True
-                    threading.Thread(target=enhanced_ai_move_thread, args=(game,), daemon=True).start()
+                    start_ai_move(game)
 
         elif game_state == GameState.PLAYING:
             is_human_turn = (game_mode == "PvP") or (game_mode == "PvB" and game.current_player == human_color)
+            poll_ai_move(game)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -1285,13 +911,14 @@ def main():
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         game_state = GameState.PAUSED
+                        stop_pondering()
                         pygame.mixer.music.pause()
                     elif event.key == pygame.K_r and pygame.key.get_pressed()[pygame.K_LCTRL]:
-                        game = Othello(sounds)
+                        reset_ai_engines()
+                        game = OthelloGame(sounds)
                         if (game_mode == "BvB") or (game_mode == "PvB" and human_color != game.current_player):
                             if not game.ai_thinking and game.valid_moves:
-                                game.ai_thinking = True
-                                threading.Thread(target=enhanced_ai_move_thread, args=(game,), daemon=True).start()
+                                start_ai_move(game)
 
                 if event.type == pygame.USEREVENT:
                     if 'move' in event.dict:
@@ -1301,8 +928,7 @@ def main():
                         if made_move and not game.game_over:
                             is_still_ai_turn = (game_mode == "BvB") or (game_mode == "PvB" and game.current_player != human_color)
                             if is_still_ai_turn and not game.ai_thinking and game.valid_moves:
-                                game.ai_thinking = True
-                                threading.Thread(target=enhanced_ai_move_thread, args=(game,), daemon=True).start()
+                                start_ai_move(game)
 
                 if is_human_turn and event.type == pygame.MOUSEBUTTONDOWN and not game.ai_thinking:
                     x, y = event.pos
@@ -1314,8 +940,7 @@ def main():
                         if made_move and not game.game_over:
                             is_now_ai_turn = (game_mode == "BvB") or (game_mode == "PvB" and game.current_player != human_color)
                             if is_now_ai_turn and not game.ai_thinking and game.valid_moves:
-                                game.ai_thinking = True
-                                threading.Thread(target=enhanced_ai_move_thread, args=(game,), daemon=True).start()
+                                start_ai_move(game)
                 
                 if event.type == pygame.MOUSEMOTION:
                     x, y = event.pos
@@ -1324,11 +949,14 @@ def main():
                     else:
                         game.hover_pos = None
             
+            if game_state == GameState.PLAYING:
+                update_pondering(game, game_mode, human_color)
             draw_animated_background(win)
             game.draw(win, font, small_font, game_mode)
             
             if game.game_over:
                 game_state = GameState.GAME_OVER
+                stop_pondering()
 
         elif game_state == GameState.PAUSED:
             result = enhanced_pause_screen(win, font, big_font)
@@ -1336,6 +964,7 @@ def main():
                 game_state = GameState.PLAYING
                 pygame.mixer.music.unpause()
             elif result == "main_menu":
+                reset_ai_engines()
                 game_state = GameState.MENU
                 pygame.mixer.music.stop()
 
@@ -1351,15 +980,16 @@ def main():
             
             result = enhanced_game_over_screen(win, font, big_font, game.winner, game.get_score(), game_stats)
             if result == "play_again":
-                game = Othello(sounds)
+                reset_ai_engines()
+                game = OthelloGame(sounds)
                 game_start_time = time.time()
                 game_state = GameState.PLAYING
                 
                 if (game_mode == "BvB") or (game_mode == "PvB" and human_color != game.current_player):
                     if not game.ai_thinking and game.valid_moves:
-                        game.ai_thinking = True
-                        threading.Thread(target=enhanced_ai_move_thread, args=(game,), daemon=True).start()
+                        start_ai_move(game)
             else:
+                reset_ai_engines()
                 game_state = GameState.MENU
                 pygame.mixer.music.stop()
 
@@ -0,0 +1,39 @@
+"""Headless Othello rules engine and AI search.
+
+Nothing in this package imports pygame, so it can be used from worker
+processes, batch analysis scripts and benchmarks without a display.
+NumPy is only imported once the batch evaluator is used: by a search with
+batch_leaves, or through the batch evaluator names below.
+"""
+
+from .bitboard import get_flips, get_moves, popcount
+from .book import OpeningBook, build_book, load_default_book
+from .constants import (CORNER_SQUARES, DIRECTIONS, EMPTY, ENDGAME_EMPTIES, GAME_TIME_BUDGETS, PLAYER_BLACK,
+                        PLAYER_WHITE, POSITION_VALUES, PROBCUT_THRESHOLDS, TIME_LIMITS, WLD_EMPTIES, Difficulty)
+from .endgame import EndgameSolver, solve_endgame
+from .evaluation import (advanced_evaluate_board, count_advanced_stable_pieces, evaluate_patterns,
+                         evaluate_position, get_phase_weights)
+from .engine import Engine
+from .evalcache import EvalCache
+from .game import LegalMoves, Othello
+from .ordering import MoveOrdering
+from .parallel import ParallelSearch
+from .ponder import Ponderer
+from .position import Position
+from .probcut import MultiProbCut, fit_probcut
+from .search import (TT_SIZE_MB, SearchTimeout, choose_move, enhanced_minimax_alphabeta,
+                     iterative_deepening)
+from .service import AIService
+from .stats import SearchStats
+from .symmetry import canonical, canonical_hash
+from .timecontrol import SearchClock, TimeManager
+from .transposition import TranspositionTable
+
+_BATCH_EVAL_NAMES = ('NUMPY_AVAILABLE', 'batch_evaluate_bitboards', 'batch_evaluate_boards')
+
+
+def __getattr__(name):
+    if name in _BATCH_EVAL_NAMES:
+        from . import batch_eval
+        return getattr(batch_eval, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
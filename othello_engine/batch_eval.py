@@ -0,0 +1,221 @@
+"""Vectorised NumPy version of advanced_evaluate_board.
+
+Scores a whole batch of positions per call, for the search frontier and
+for analysis jobs. NumPy is optional: the rest of the engine works without
+it, and ``NUMPY_AVAILABLE`` tells callers whether this module can be used.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from .constants import PLAYER_BLACK, PLAYER_WHITE
+from .evaluation import CORNER_X_BITS, EDGE_TABLES, PHASE_WEIGHTS
+from .geometry import (ANTI_DIAGONAL_LINE_MASKS, BORDER_MASK, DIAGONAL_LINE_MASKS, NORTH_SOUTH_BORDER,
+                       POSITION_VALUE_MASKS, WEST_EAST_BORDER)
+from .patterns import TERNARY
+
+NUMPY_AVAILABLE = np is not None
+
+# =============================================================================
+# 1. Masks (from the geometry index, as uint64)
+# =============================================================================
+
+if NUMPY_AVAILABLE:
+    _U64 = np.uint64
+    _SQUARE_BITS = np.array([1 << sq for sq in range(64)], dtype=_U64)
+    _INNER_COLUMNS = _U64(0x7E7E7E7E7E7E7E7E)
+    _NOT_COL0 = _U64(0xFEFEFEFEFEFEFEFE)
+    _NOT_COL7 = _U64(0x7F7F7F7F7F7F7F7F)
+    _SHIFTS = tuple((_U64(shift), use_inner) for shift, use_inner in ((1, True), (7, True), (8, False), (9, True)))
+
+    # X-square penalties are added in the scalar function's order so float sums round identically
+    _CORNER_X_BITS = [(_U64(corner_bit), _U64(x_bit)) for corner_bit, x_bit in CORNER_X_BITS]
+    _POSITION_MASKS = [(value, _U64(mask)) for value, mask in POSITION_VALUE_MASKS.items()]
+    _COL0 = _U64(0x0101010101010101)
+    _ROW0 = _U64(0xFF)
+    _DIAGONAL_LINES = [_U64(mask) for mask in DIAGONAL_LINE_MASKS]
+    _ANTI_DIAGONAL_LINES = [_U64(mask) for mask in ANTI_DIAGONAL_LINE_MASKS]
+    _WEST_EAST_BORDER = _U64(WEST_EAST_BORDER)
+    _NORTH_SOUTH_BORDER = _U64(NORTH_SOUTH_BORDER)
+    _BORDER = _U64(BORDER_MASK)
+
+    # Weight columns indexed by phase: 0 opening, 1 mid-game, 2 end-game
+    _WEIGHTS = {name: np.array([phase[name] for phase in PHASE_WEIGHTS], dtype=np.int64)
+                for name in PHASE_WEIGHTS[0]}
+    _EDGE_TABLES = np.array(EDGE_TABLES, dtype=np.int64)  # (phase, edge, index)
+    _TERNARY = np.array(TERNARY, dtype=np.int64)
+    _COLUMN_GATHER = _U64(0x0102040810204080)
+    _BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+# =============================================================================
+# 2. Vectorised Bit Operations
+# =============================================================================
+
+def _popcount(x):
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x).astype(np.int64)
+    return _BYTE_POPCOUNT[x.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+def _moves(own, opp):
+    empty = ~(own | opp)
+    inner = opp & _INNER_COLUMNS
+    moves = np.zeros_like(own)
+    for shift, use_inner in _SHIFTS:
+        o = inner if use_inner else opp
+
+        x = (own << shift) & o
+        for _ in range(5):
+            x |= (x << shift) & o
+        moves |= x << shift
+
+        x = (own >> shift) & o
+        for _ in range(5):
+            x |= (x >> shift) & o
+        moves |= x >> shift
+    return moves & empty
+
+
+def _full_lines(occupied):
+    """Vector form of stability.full_lines."""
+    rows = occupied & (occupied >> _U64(1))
+    rows &= rows >> _U64(2)
+    rows &= rows >> _U64(4)
+    columns = occupied & (occupied >> _U64(8))
+    columns &= columns >> _U64(16)
+    columns &= columns >> _U64(32)
+    diagonals = np.zeros_like(occupied)
+    for line in _DIAGONAL_LINES:
+        diagonals |= np.where((occupied & line) == line, line, _U64(0))
+    anti_diagonals = np.zeros_like(occupied)
+    for line in _ANTI_DIAGONAL_LINES:
+        anti_diagonals |= np.where((occupied & line) == line, line, _U64(0))
+    return (rows & _COL0) * _ROW0, (columns & _ROW0) * _COL0, diagonals, anti_diagonals
+
+
+def _stable(own, opp, exact):
+    """Vector form of stability.stable_discs, as counts."""
+    if exact:
+        full_rows, full_columns, full_diagonals, full_anti_diagonals = _full_lines(own | opp)
+    else:
+        full_rows = full_columns = full_diagonals = full_anti_diagonals = _U64(0)
+    horizontal = _WEST_EAST_BORDER | full_rows
+    vertical = _NORTH_SOUTH_BORDER | full_columns
+    diagonal = _BORDER | full_diagonals
+    anti_diagonal = _BORDER | full_anti_diagonals
+
+    one, seven, eight, nine = _U64(1), _U64(7), _U64(8), _U64(9)
+    stable = np.zeros_like(own)
+    while True:
+        grown = (own
+                 & (horizontal | ((stable << one) & _NOT_COL0) | ((stable >> one) & _NOT_COL7))
+                 & (vertical | (stable << eight) | (stable >> eight))
+                 & (diagonal | ((stable << nine) & _NOT_COL0) | ((stable >> nine) & _NOT_COL7))
+                 & (anti_diagonal | ((stable << seven) & _NOT_COL7) | ((stable >> seven) & _NOT_COL0)))
+        if np.array_equal(grown, stable):
+            return _popcount(stable)
+        stable = grown
+
+
+def _edge_indices(own, opp):
+    """Vector form of patterns.edge_indices, as a list of four index arrays."""
+    byte, top_byte = _U64(0xFF), _U64(56)
+    indices = []
+    for own_bits, opp_bits in (
+            (own & byte, opp & byte),
+            (own >> top_byte, opp >> top_byte),
+            (((own & _COL0) * _COLUMN_GATHER) >> top_byte, ((opp & _COL0) * _COLUMN_GATHER) >> top_byte),
+            ((((own >> _U64(7)) & _COL0) * _COLUMN_GATHER) >> top_byte,
+             (((opp >> _U64(7)) & _COL0) * _COLUMN_GATHER) >> top_byte)):
+        indices.append(_TERNARY[own_bits.astype(np.int64)] + 2 * _TERNARY[opp_bits.astype(np.int64)])
+    return indices
+
+
+# =============================================================================
+# 3. Batch Evaluation
+# =============================================================================
+
+def boards_to_bitboards(boards):
+    """Converts an (N, 64) or (N, 8, 8) array of cells into black/white uint64 arrays."""
+    cells = np.asarray(boards).reshape(-1, 64)
+    black = np.bitwise_or.reduce(np.where(cells == PLAYER_BLACK, _SQUARE_BITS, _U64(0)), axis=1)
+    white = np.bitwise_or.reduce(np.where(cells == PLAYER_WHITE, _SQUARE_BITS, _U64(0)), axis=1)
+    return black, white
+
+
+def batch_evaluate_bitboards(black, white, player, total_pieces, depth_remaining=0, exact_stability=True):
+    """Scores N positions given as black/white bitboard arrays.
+
+    ``player``, ``total_pieces`` and ``depth_remaining`` may be scalars or
+    length-N arrays. Returns a float64 array equal, element for element, to
+    advanced_evaluate_board on the same inputs.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("batch evaluation requires numpy")
+
+    black = np.asarray(black, dtype=_U64).reshape(-1)
+    white = np.asarray(white, dtype=_U64).reshape(-1)
+    n = black.shape[0]
+    player = np.broadcast_to(np.asarray(player), (n,))
+    total_pieces = np.broadcast_to(np.asarray(total_pieces, dtype=np.int64), (n,))
+    depth_remaining = np.broadcast_to(np.asarray(depth_remaining, dtype=np.int64), (n,))
+
+    is_black = player == PLAYER_BLACK
+    own = np.where(is_black, black, white)
+    opp = np.where(is_black, white, black)
+
+    phase = np.where(total_pieces < 20, 0, np.where(total_pieces < 52, 1, 2))
+    w = {name: weights[phase] for name, weights in _WEIGHTS.items()}
+
+    score = np.zeros(n, dtype=np.float64)
+
+    # 1. Piece count with parity consideration
+    piece_diff = (_popcount(own) - _popcount(opp)).astype(np.float64)
+    piece_diff += np.where((total_pieces > 55) & ((64 - total_pieces) % 2 == 1), 0.5, 0.0)
+    score += w['piece'] * piece_diff
+
+    # 2. Mobility
+    my_moves = _popcount(_moves(own, opp))
+    opp_moves = _popcount(_moves(opp, own))
+    mobility_ratio = (my_moves - opp_moves) / (my_moves + opp_moves + 1)
+    score += np.where(my_moves + opp_moves > 0, w['mobility'] * mobility_ratio * 100, 0.0)
+    score -= np.where((my_moves == 0) & (opp_moves > 0), 500, 0)
+    score += np.where((opp_moves == 0) & (my_moves > 0), 500, 0)
+
+    # 3. Edge pattern tables
+    edge_score = np.zeros(n, dtype=np.int64)
+    for edge, indices in enumerate(_edge_indices(own, opp)):
+        edge_score += _EDGE_TABLES[phase, edge, indices]
+    score += edge_score
+
+    # 4. X-squares next to empty corners
+    occupied = own | opp
+    for corner, x_bit in _CORNER_X_BITS:
+        corner_empty = (occupied & corner) == 0
+        score += np.where(corner_empty & ((own & x_bit) != 0), -225,
+                          np.where(corner_empty & ((opp & x_bit) != 0), 25, 0))
+
+    # 5. Stable discs
+    score += w['stability'] * (_stable(own, opp, exact_stability) - _stable(opp, own, exact_stability))
+
+    # 6. Positional values
+    position_score = np.zeros(n, dtype=np.int64)
+    for value, mask in _POSITION_MASKS:
+        position_score += value * (_popcount(own & mask) - _popcount(opp & mask))
+    score += w['position'] * position_score
+
+    # 7. Depth bonus
+    score += np.where(depth_remaining > 0, depth_remaining * 2, 0)
+
+    return score
+
+
+def batch_evaluate_boards(boards, player, total_pieces, depth_remaining=0, exact_stability=True):
+    """Scores an (N, 64) or (N, 8, 8) array of list-style boards."""
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("batch evaluation requires numpy")
+    black, white = boards_to_bitboards(boards)
+    return batch_evaluate_bitboards(black, white, player, total_pieces, depth_remaining, exact_stability)
@@ -0,0 +1,112 @@
+"""Bitboard move generation for Othello.
+
+Each side is held as a 64-bit integer mask where bit ``r * 8 + c`` is set
+when that side owns the square at row ``r``, column ``c``.
+"""
+
+from .geometry import RAY_MASKS_DOWN, RAY_MASKS_UP
+
+# =============================================================================
+# 1. Masks and Square Helpers
+# =============================================================================
+
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+# Columns B..G; masking the opponent with this stops horizontal and diagonal
+# fills from wrapping around the board edge.
+INNER_COLUMNS = 0x7E7E7E7E7E7E7E7E
+NOT_COL0 = 0xFEFEFEFEFEFEFEFE
+NOT_COL7 = 0x7F7F7F7F7F7F7F7F
+
+# (shift, uses_inner_mask) for the four line directions; get_moves walks
+# each both with << (towards higher squares) and >> (towards lower squares).
+SHIFTS = ((1, True), (7, True), (8, False), (9, True))
+
+
+def square_index(r, c):
+    return r * 8 + c
+
+
+def square_to_rc(sq):
+    return divmod(sq, 8)
+
+
+def popcount(mask):
+    return mask.bit_count()
+
+
+def iter_squares(mask):
+    """Yields the square index of every set bit, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def mask_to_positions(mask):
+    return [divmod(sq, 8) for sq in iter_squares(mask)]
+
+
+def board_to_bitboards(board, black=1, white=-1):
+    """Converts a list-of-lists board into (black_mask, white_mask)."""
+    black_bits = white_bits = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == black:
+                black_bits |= bit
+            elif cell == white:
+                white_bits |= bit
+            bit <<= 1
+    return black_bits, white_bits
+
+
+# =============================================================================
+# 2. Move Generation
+# =============================================================================
+
+def get_moves(own, opp):
+    """Returns the mask of squares where ``own`` may legally play."""
+    empty = ~(own | opp) & FULL_MASK
+    inner = opp & INNER_COLUMNS
+    moves = 0
+    for shift, use_inner in SHIFTS:
+        o = inner if use_inner else opp
+
+        x = (own << shift) & o
+        x |= (x << shift) & o
+        x |= (x << shift) & o
+        x |= (x << shift) & o
+        x |= (x << shift) & o
+        x |= (x << shift) & o
+        moves |= x << shift
+
+        x = (own >> shift) & o
+        x |= (x >> shift) & o
+        x |= (x >> shift) & o
+        x |= (x >> shift) & o
+        x |= (x >> shift) & o
+        x |= (x >> shift) & o
+        moves |= x >> shift
+    return moves & empty
+
+
+def get_flips(own, opp, sq):
+    """Returns the mask of discs flipped when ``own`` plays on ``sq``.
+
+    Uses the precomputed rays from ``sq``: in each direction the nearest
+    square that is not an opponent disc ends the run, and the run flips
+    when that square is ours.
+    """
+    flips = 0
+    for ray in RAY_MASKS_UP[sq]:
+        blockers = ray & ~opp
+        nearest = blockers & -blockers
+        if nearest & own:
+            flips |= ray & (nearest - 1)
+    for ray in RAY_MASKS_DOWN[sq]:
+        blockers = ray & ~opp
+        if blockers:
+            nearest = 1 << (blockers.bit_length() - 1)
+            if nearest & own:
+                flips |= ray & ~((nearest << 1) - 1)
+    return flips
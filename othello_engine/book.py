@@ -0,0 +1,199 @@
+"""Opening book: precomputed moves for the first plies of the game.
+
+Entries are stored for the side to move, as (own, opponent) bitboards
+in canonical form (see othello_engine.symmetry), so one entry answers every
+rotation and reflection of a position and either colour. The key is the
+Zobrist hash of the canonical boards.
+
+File format, little-endian: the header ``MAGIC``, a u16 version and a u32
+entry count, then the entries sorted by key, each packed as ENTRY_FORMAT:
+key u64, own u64, opponent u64, move u8 (square in the canonical frame),
+depth u8, score i32 (evaluation, rounded). OpeningBook.load reads the file
+into a dict, or with use_mmap=True binary-searches the mapped file and
+reads nothing up front.
+
+Build or extend a book from engine self-analysis with:
+
+    python -m othello_engine.book [path] [max_plies] [full_width_plies] [depth]
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+
+from .bitboard import iter_squares
+from .position import Position
+from .search import iterative_deepening
+from .symmetry import INVERSE_SQUARES, SYMMETRY_SQUARES, board_hash, canonical
+
+BOOK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'opening_book.bin')
+
+MAGIC = b'OTBK'
+VERSION = 1
+HEADER_FORMAT = '<4sHI'
+ENTRY_FORMAT = '<QQQBBi'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+ENTRY_SIZE = struct.calcsize(ENTRY_FORMAT)
+
+# =============================================================================
+# 1. Book
+# =============================================================================
+
+class OpeningBook:
+    """Opening book keyed by the hash of the canonical position."""
+
+    def __init__(self):
+        self.entries = {}  # key -> (own, opp, move, depth, score)
+        self._mapped = None
+        self._mapped_count = 0
+
+    def __len__(self):
+        return len(self.entries) + self._mapped_count
+
+    @staticmethod
+    def _key(position):
+        own, opp, symmetry = canonical(*position.bitboards(position.side))
+        return board_hash(own, opp, False), own, opp, symmetry
+
+    def _find_mapped(self, key):
+        lo, hi = 0, self._mapped_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER_SIZE + mid * ENTRY_SIZE
+            entry_key = struct.unpack_from('<Q', self._mapped, offset)[0]
+            if entry_key < key:
+                lo = mid + 1
+            elif entry_key > key:
+                hi = mid
+            else:
+                return struct.unpack_from(ENTRY_FORMAT, self._mapped, offset)[1:]
+        return None
+
+    def probe(self, position):
+        """Returns (move, score, depth) for position, or None if it is not in the book.
+
+        move is (row, col) in position's own orientation; score is from the
+        side to move's point of view.
+        """
+        key, own, opp, symmetry = self._key(position)
+        entry = self.entries.get(key)
+        if entry is None and self._mapped is not None:
+            entry = self._find_mapped(key)
+        if entry is None or entry[0] != own or entry[1] != opp:
+            return None
+        _, _, move, depth, score = entry
+        sq = INVERSE_SQUARES[symmetry][move]
+        if not position.legal_moves() >> sq & 1:
+            return None
+        return divmod(sq, 8), score, depth
+
+    def add(self, position, move, score, depth):
+        """Stores move ((row, col), in position's orientation) for position."""
+        key, own, opp, symmetry = self._key(position)
+        sq = SYMMETRY_SQUARES[symmetry][move[0] * 8 + move[1]]
+        self.entries[key] = (own, opp, sq, depth, int(round(score)))
+
+    def save(self, path):
+        """Writes every entry, including any from a mapped file, sorted by key."""
+        entries = dict(self._iter_mapped())
+        entries.update(self.entries)
+        with open(path, 'wb') as f:
+            f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(entries)))
+            for key in sorted(entries):
+                f.write(struct.pack(ENTRY_FORMAT, key, *entries[key]))
+
+    def _iter_mapped(self):
+        for i in range(self._mapped_count):
+            key, *entry = struct.unpack_from(ENTRY_FORMAT, self._mapped, HEADER_SIZE + i * ENTRY_SIZE)
+            yield key, tuple(entry)
+
+    @classmethod
+    def load(cls, path, use_mmap=False):
+        """Opens a book file; raises ValueError if it is not one."""
+        book = cls()
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else f.read()
+        magic, version, count = struct.unpack_from(HEADER_FORMAT, data, 0)
+        if magic != MAGIC or version != VERSION or len(data) != HEADER_SIZE + count * ENTRY_SIZE:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        book._mapped, book._mapped_count = data, count
+        if not use_mmap:
+            book.entries = dict(book._iter_mapped())
+            book._mapped, book._mapped_count = None, 0
+        return book
+
+
+def load_default_book(use_mmap=True):
+    """The book shipped next to the game, or None if there is none."""
+    try:
+        return OpeningBook.load(BOOK_PATH, use_mmap)
+    except (OSError, ValueError):
+        return None
+
+
+# =============================================================================
+# 2. Builder
+# =============================================================================
+
+def build_book(book, max_plies=10, full_width_plies=3, depth=6, time_limit=math.inf, progress=None):
+    """Extends book from engine self-analysis.
+
+    Every move is followed for the first full_width_plies plies, then only
+    the book move, up to max_plies. Positions already in the book are not
+    searched again, so building is resumable. Returns the number of
+    positions added.
+    """
+    added = 0
+    seen = set()
+    frontier = [(Position(), 0)]
+    while frontier:
+        position, ply = frontier.pop()
+        key = OpeningBook._key(position)[0]
+        if key in seen:
+            continue
+        seen.add(key)
+
+        entry = book.probe(position)
+        if entry is None:
+            score, move, _, _ = iterative_deepening(position, depth, position.side, time.time(), time_limit)
+            book.add(position, move, score, depth)
+            entry = (move, score, depth)
+            added += 1
+            if progress is not None:
+                progress(len(book), ply, move, score)
+
+        if ply + 1 > max_plies:
+            continue
+        moves = position.legal_moves()
+        if ply >= full_width_plies:
+            moves = 1 << (entry[0][0] * 8 + entry[0][1])
+        for sq in iter_squares(moves):
+            child = position.copy()
+            child.apply_move(sq)
+            if not child.legal_moves():
+                if child.is_game_over():
+                    continue
+                child.apply_pass()
+            frontier.append((child, ply + 1))
+    return added
+
+
+def _main(argv):
+    path = argv[1] if len(argv) > 1 else BOOK_PATH
+    max_plies, full_width_plies, depth = (int(arg) for arg in (argv[2:5] + ['10', '3', '6'][len(argv[2:5]):]))
+    try:
+        book = OpeningBook.load(path)
+    except OSError:
+        book = OpeningBook()
+    start = time.time()
+    added = build_book(book, max_plies, full_width_plies, depth,
+                       progress=lambda size, ply, move, score: print(f"{size:5d} ply {ply:2d} {move} {score:8.1f}"))
+    book.save(path)
+    print(f"added {added} positions in {time.time() - start:.1f}s, {len(book)} in {path}")
+
+
+if __name__ == '__main__':
+    _main(sys.argv)
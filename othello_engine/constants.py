@@ -0,0 +1,67 @@
+from enum import Enum
+
+# --- Game Constants ---
+PLAYER_BLACK = 1
+PLAYER_WHITE = -1
+EMPTY = 0
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+CORNER_SQUARES = {0, 7, 56, 63}
+
+# --- AI Settings ---
+class Difficulty(Enum):
+    EASY = 2
+    MEDIUM = 4
+    HARD = 6
+    EXPERT = 8
+    GRANDMASTER = 10
+
+TIME_LIMITS = {
+    Difficulty.EASY: 1.0,
+    Difficulty.MEDIUM: 3.0,
+    Difficulty.HARD: 8.0,
+    Difficulty.EXPERT: 15.0,
+    Difficulty.GRANDMASTER: 30.0
+}
+
+# Thinking time of one AI player over a whole game, shared out over its
+# moves by othello_engine.timecontrol.TimeManager
+GAME_TIME_BUDGETS = {difficulty: 30 * limit for difficulty, limit in TIME_LIMITS.items()}
+
+# Empty squares at or below which the endgame solver replaces the heuristic
+# search: exactly (best disc difference) or win/loss/draw only
+ENDGAME_EMPTIES = {
+    Difficulty.EASY: 4,
+    Difficulty.MEDIUM: 8,
+    Difficulty.HARD: 12,
+    Difficulty.EXPERT: 14,
+    Difficulty.GRANDMASTER: 16
+}
+WLD_EMPTIES = {
+    Difficulty.EASY: 4,
+    Difficulty.MEDIUM: 10,
+    Difficulty.HARD: 14,
+    Difficulty.EXPERT: 16,
+    Difficulty.GRANDMASTER: 18
+}
+
+# Multi-ProbCut confidence threshold in sigmas (see othello_engine.probcut);
+# None searches every move to full depth
+PROBCUT_THRESHOLDS = {
+    Difficulty.EASY: None,
+    Difficulty.MEDIUM: None,
+    Difficulty.HARD: None,
+    Difficulty.EXPERT: 1.5,
+    Difficulty.GRANDMASTER: 1.0
+}
+
+# --- Positional Values Matrix ---
+POSITION_VALUES = [
+    [100, -20,  10,   5,   5,  10, -20, 100],
+    [-20, -50,  -2,  -2,  -2,  -2, -50, -20],
+    [ 10,  -2,  -1,  -1,  -1,  -1,  -2,  10],
+    [  5,  -2,  -1,  -1,  -1,  -1,  -2,   5],
+    [  5,  -2,  -1,  -1,  -1,  -1,  -2,   5],
+    [ 10,  -2,  -1,  -1,  -1,  -1,  -2,  10],
+    [-20, -50,  -2,  -2,  -2,  -2, -50, -20],
+    [100, -20,  10,   5,   5,  10, -20, 100]
+]
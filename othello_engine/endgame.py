@@ -0,0 +1,226 @@
+"""Endgame solver for the last few empty squares.
+
+Once few enough squares are left the position can be searched to the end
+instead of estimated. The solver works on raw (own, opponent) bitboards in
+negamax form and scores final disc difference (own - opponent) for the side
+to move. Two modes:
+
+- exact: the true disc difference, searched with a full window;
+- WLD (win/loss/draw): only the sign, searched with the window (-1, 1),
+  which prunes far more and is the cheaper way to know a move wins.
+
+Move ordering is fastest-first (fewest opponent replies) with a bonus for
+squares in quadrants holding an odd number of empties (parity), and near
+the end the last four empties are solved by dedicated code that walks the
+empty list instead of generating moves.
+"""
+
+import time
+
+from .bitboard import FULL_MASK, get_flips, get_moves, iter_squares, popcount
+from .geometry import CORNER_MASK, REGION, REGION_MASKS
+from .timecontrol import SearchTimeout
+
+# Below this many empties moves are ordered by parity only
+FASTEST_FIRST_EMPTIES = 7
+# Positions with at least this many empties are cached between visits
+CACHE_MIN_EMPTIES = 6
+# Only nodes with at least this many empties poll the clock
+TIME_CHECK_EMPTIES = 7
+SMALL_EMPTIES = 4
+
+WLD_WINDOW = (-1, 1)
+EXACT_WINDOW = (-64, 64)
+
+
+# =============================================================================
+# 1. Last Empties
+# =============================================================================
+
+def _final_score(own, opp):
+    return popcount(own) - popcount(opp)
+
+
+def _solve_last(own, opp, sq):
+    """Score with a single empty square left."""
+    flips = get_flips(own, opp, sq)
+    if flips:
+        count = popcount(flips)
+        return popcount(own) - popcount(opp) + 2 * count + 1
+    flips = get_flips(opp, own, sq)
+    if flips:
+        count = popcount(flips)
+        return popcount(own) - popcount(opp) - 2 * count - 1
+    return popcount(own) - popcount(opp)
+
+
+def _solve_small(own, opp, alpha, beta, squares, passed):
+    """Solves 2-4 empties by trying each empty square in turn."""
+    best = -65
+    for i, sq in enumerate(squares):
+        flips = get_flips(own, opp, sq)
+        if not flips:
+            continue
+        new_own = own | flips | (1 << sq)
+        new_opp = opp ^ flips
+        rest = squares[:i] + squares[i + 1:]
+        if len(rest) == 1:
+            score = -_solve_last(new_opp, new_own, rest[0])
+        else:
+            score = -_solve_small(new_opp, new_own, -beta, -alpha, rest, False)
+        if score > best:
+            best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    return best
+
+    if best == -65:
+        if passed:
+            return _final_score(own, opp)
+        return -_solve_small(opp, own, -beta, -alpha, squares, True)
+    return best
+
+
+def _parity_order(empty_mask):
+    """Empty squares, those in odd-count quadrants first."""
+    odd = []
+    even = []
+    for sq in iter_squares(empty_mask):
+        if popcount(empty_mask & REGION_MASKS[REGION[sq]]) & 1:
+            odd.append(sq)
+        else:
+            even.append(sq)
+    return odd + even
+
+
+# =============================================================================
+# 2. Main Solver
+# =============================================================================
+
+class EndgameSolver:
+    """Negamax endgame search with a node count and a per-solve cache of
+    (lower bound, upper bound, best square) keyed by (own, opponent)."""
+
+    def __init__(self, start_time, time_limit):
+        self.start_time = start_time
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.cache = {}
+
+    def _ordered_moves(self, own, opp, moves, empty_mask, empties, hash_move=None):
+        if empties < FASTEST_FIRST_EMPTIES:
+            return [(sq, get_flips(own, opp, sq)) for sq in _parity_order(empty_mask) if moves >> sq & 1]
+
+        scored = []
+        for sq in iter_squares(moves):
+            flips = get_flips(own, opp, sq)
+            new_own = own | flips | (1 << sq)
+            # Fastest first: fewest replies, then parity and corners
+            key = popcount(get_moves(opp ^ flips, new_own)) * 4
+            if not popcount(empty_mask & REGION_MASKS[REGION[sq]]) & 1:
+                key += 2
+            if not CORNER_MASK >> sq & 1:
+                key += 1
+            if sq == hash_move:
+                key = -1
+            scored.append((key, sq, flips))
+        scored.sort(key=lambda x: x[0])
+        return [(sq, flips) for _, sq, flips in scored]
+
+    def search(self, own, opp, alpha, beta, passed=False):
+        """Disc difference for own to move, fail-soft within (alpha, beta)."""
+        self.nodes += 1
+        empty_mask = ~(own | opp) & FULL_MASK
+        empties = popcount(empty_mask)
+        if empties <= SMALL_EMPTIES:
+            if empties == 0:
+                return _final_score(own, opp)
+            if empties == 1:
+                return _solve_last(own, opp, empty_mask.bit_length() - 1)
+            return _solve_small(own, opp, alpha, beta, _parity_order(empty_mask), passed)
+
+        if empties >= TIME_CHECK_EMPTIES and time.time() - self.start_time > self.time_limit:
+            raise SearchTimeout
+
+        moves = get_moves(own, opp)
+        if not moves:
+            if passed or not get_moves(opp, own):
+                return _final_score(own, opp)
+            return -self.search(opp, own, -beta, -alpha, True)
+
+        alpha_orig = alpha
+        key = hash_move = None
+        if empties >= CACHE_MIN_EMPTIES:
+            key = (own, opp)
+            entry = self.cache.get(key)
+            if entry is not None:
+                lower, upper, hash_move = entry
+                if lower >= beta:
+                    return lower
+                if upper <= alpha:
+                    return upper
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+            alpha_orig = alpha
+
+        best, best_sq = -65, None
+        for i, (sq, flips) in enumerate(self._ordered_moves(own, opp, moves, empty_mask, empties, hash_move)):
+            new_own = own | flips | (1 << sq)
+            new_opp = opp ^ flips
+            if i == 0:
+                score = -self.search(new_opp, new_own, -beta, -alpha)
+            else:
+                # Scores are whole discs, so (alpha, alpha + 1) is a true null window
+                score = -self.search(new_opp, new_own, -alpha - 1, -alpha)
+                if alpha < score < beta:
+                    score = -self.search(new_opp, new_own, -beta, -score)
+            if score > best:
+                best, best_sq = score, sq
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if key is not None:
+            lower, upper, _ = self.cache.get(key, (-64, 64, None))
+            if best <= alpha_orig:
+                upper = min(upper, best)
+            elif best >= beta:
+                lower = max(lower, best)
+            else:
+                lower = upper = best
+            self.cache[key] = (lower, upper, best_sq)
+        return best
+
+    def solve_root(self, position, exact=True):
+        """Solves position for its side to move.
+
+        Returns (score, best_move, evaluated_moves) like
+        enhanced_minimax_alphabeta, with scores in discs (sign only in WLD
+        mode) from the side to move's point of view.
+        """
+        own, opp = position.bitboards(position.side)
+        alpha, beta = EXACT_WINDOW if exact else WLD_WINDOW
+        moves = get_moves(own, opp)
+        empty_mask = ~(own | opp) & FULL_MASK
+
+        evaluated_moves = []
+        best, best_move = -65, None
+        for sq, flips in self._ordered_moves(own, opp, moves, empty_mask, popcount(empty_mask)):
+            score = -self.search(opp ^ flips, own | flips | (1 << sq), -beta, -alpha)
+            evaluated_moves.append((score, divmod(sq, 8)))
+            if score > best:
+                best, best_move = score, divmod(sq, 8)
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        evaluated_moves.sort(key=lambda x: x[0], reverse=True)
+        return best, best_move, evaluated_moves
+
+
+def solve_endgame(position, start_time, time_limit, exact=True):
+    """Solves position to the end; raises SearchTimeout if time runs out."""
+    return EndgameSolver(start_time, time_limit).solve_root(position, exact)
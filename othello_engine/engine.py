@@ -0,0 +1,102 @@
+"""The AI player as a long-lived object.
+
+An Engine keeps its transposition table, move ordering tables and last
+principal variation from one move to the next. The position two plies on
+was almost always inside the previous search tree, so the first iterations
+of the next search come back from the table nearly for free. Between moves
+table entries are aged rather than cleared, killers move up with the root
+and the history table decays (TranspositionTable.new_search,
+MoveOrdering.age). Leaf evaluations are cached for the whole game
+(othello_engine.evalcache). Pondering fills the same tables.
+
+Table scores belong to one player, so every AI side needs its own Engine;
+new_game() resets one for a new game.
+"""
+
+from .evalcache import EVAL_CACHE_ENTRIES, EvalCache
+from .ordering import MoveOrdering
+from .ponder import Ponderer
+from .search import TT_SIZE_MB, choose_move, search_settings
+from .stats import STATS_ENABLED, SearchStats
+from .transposition import TranspositionTable
+
+MAX_PV_LENGTH = 16
+
+
+class Engine:
+    """One AI side: opening book, search state and pondering across a game."""
+
+    def __init__(self, book=None, tt_size_mb=TT_SIZE_MB, eval_cache_entries=EVAL_CACHE_ENTRIES):
+        self.book = book
+        self.tt = TranspositionTable(tt_size_mb)
+        self.eval_cache = EvalCache(eval_cache_entries)
+        self.ordering = MoveOrdering()
+        self.ponderer = Ponderer()
+        self.pv = []  # principal variation of the last search, as (row, col)
+        self.last_stats = None  # SearchStats of the last move, unless STATS_ENABLED is off
+        self._root_discs = None
+
+    def new_game(self):
+        self.ponderer.stop()
+        self.tt.clear()
+        self.eval_cache.clear()
+        self.ordering.clear()
+        self.pv = []
+        self.last_stats = None
+        self._root_discs = None
+
+    def _prepare(self, total_discs):
+        """Ages the carried state for a search whose root has total_discs discs."""
+        if self._root_discs is not None and total_discs > self._root_discs:
+            self.tt.new_search()
+            self.ordering.age(total_discs - self._root_discs)
+        self._root_discs = total_discs
+
+    def _principal_variation(self, position):
+        """Follows table moves from position."""
+        position = position.copy()
+        pv = []
+        while len(pv) < MAX_PV_LENGTH:
+            entry = self.tt.probe(position.hash)
+            if entry is None or entry[4] is None or not position.legal_moves() >> entry[4] & 1:
+                break
+            pv.append(divmod(entry[4], 8))
+            position.apply_move(entry[4])
+        return pv
+
+    def ponder(self, game, difficulty):
+        """Searches on the opponent's time while they are game's current player."""
+        self._prepare(game.position.total_discs + 1)
+        expected = self.pv[1][0] * 8 + self.pv[1][1] if len(self.pv) > 1 else None
+        self.ponderer.start(game.position, -game.current_player, difficulty, self.tt, self.ordering, expected,
+                            self.eval_cache)
+
+    def choose_move(self, game, difficulty, workers=1, time_manager=None):
+        """Picks a move for game's current player; returns (best_move, evaluated_moves).
+
+        The book answers first, then a ponder search of the move just
+        played if it reached the depth of a normal search (search_settings),
+        else a search that starts from the carried state. The move's
+        statistics are left in last_stats.
+        """
+        self.last_stats = stats = SearchStats() if STATS_ENABLED else None
+        pondered = self.ponderer.take(game.position)
+        book_entry = self.book.probe(game.position) if self.book is not None else None
+        if book_entry is not None:
+            best_move, score, depth = book_entry
+            if stats is not None:
+                stats.source, stats.depth = 'book', depth
+            return best_move, [(score, best_move)]
+        if pondered is not None and pondered[0] is not None and pondered[0][3] >= search_settings(difficulty)[0]:
+            _, best_move, evaluated_moves, depth = pondered[0]
+            if stats is not None:
+                stats.source, stats.depth = 'ponder', depth
+            self.pv = self._principal_variation(game.position)
+            return best_move, evaluated_moves
+
+        self._prepare(game.position.total_discs)
+        best_move, evaluated_moves = choose_move(game, difficulty, workers=workers, tt=self.tt,
+                                                 ordering=self.ordering, time_manager=time_manager,
+                                                 eval_cache=self.eval_cache, stats=stats)
+        self.pv = self._principal_variation(game.position)
+        return best_move, evaluated_moves
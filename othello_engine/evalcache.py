@@ -0,0 +1,73 @@
+"""Bounded cache of static evaluations.
+
+The search reaches the same leaf again and again: through transpositions,
+null-window tries that are re-searched, aspiration re-searches, internal
+iterative deepening and ProbCut's shallow searches, and from one iteration
+or move to the next. An evaluation depends only on the position and the
+player it is scored for, so it is cached under the position's hash with a
+key for that player folded in, and the least recently used entries are
+dropped once the cache is full.
+
+With symmetric=True positions are keyed by their canonical hash instead
+(see othello_engine.symmetry); the evaluator scores all eight symmetric
+images alike, so they can share an entry.
+"""
+
+import random
+from collections import OrderedDict
+
+from .constants import PLAYER_BLACK
+from .evaluation import evaluate_position
+from .symmetry import canonical_hash
+
+EVAL_CACHE_ENTRIES = 1 << 16
+
+# Folded into the key of evaluations for white
+_WHITE_KEY = random.Random(0xE7A1).getrandbits(64)
+
+
+class EvalCache:
+    """LRU cache in front of evaluate_position, with hit and miss counts."""
+
+    def __init__(self, max_entries=EVAL_CACHE_ENTRIES, symmetric=False):
+        self.max_entries = max_entries
+        self.symmetric = symmetric
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def evaluate(self, position, player, depth_remaining=0):
+        """evaluate_position(position, player, depth_remaining), from the cache when possible."""
+        if depth_remaining:
+            return evaluate_position(position, player, depth_remaining)  # not worth a slot
+        if self.symmetric:
+            key = canonical_hash(position.black, position.white, position.side != PLAYER_BLACK)[0]
+        else:
+            key = position.hash
+        if player != PLAYER_BLACK:
+            key ^= _WHITE_KEY
+
+        entries = self.entries
+        score = entries.get(key)
+        if score is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return score
+        self.misses += 1
+        score = evaluate_position(position, player)
+        entries[key] = score
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return score
@@ -0,0 +1,171 @@
+from .bitboard import board_to_bitboards, get_moves, popcount
+from .constants import PLAYER_BLACK
+from .geometry import CORNER_PATTERN_BITS, EDGE_LINE_MASKS, POSITION_VALUE_MASKS
+from .patterns import SWAP_DIGITS, build_edge_tables, edge_indices
+from .stability import stable_disc_counts, stable_discs
+
+OPENING_WEIGHTS = {
+    'piece': 1, 'mobility': 20, 'corner': 150, 'edge': 10,
+    'stability': 100, 'position': 15, 'parity': 5
+}
+MIDGAME_WEIGHTS = {
+    'piece': 8, 'mobility': 15, 'corner': 120, 'edge': 15,
+    'stability': 120, 'position': 12, 'parity': 10
+}
+ENDGAME_WEIGHTS = {
+    'piece': 25, 'mobility': 8, 'corner': 140, 'edge': 20,
+    'stability': 140, 'position': 5, 'parity': 30
+}
+
+
+PHASE_WEIGHTS = (OPENING_WEIGHTS, MIDGAME_WEIGHTS, ENDGAME_WEIGHTS)
+# EDGE_TABLES[phase][edge][index]: corner, edge, C-square and wall terms of one edge
+EDGE_TABLES = build_edge_tables(PHASE_WEIGHTS)
+# Per corner: (corner bit, X-square bit)
+CORNER_X_BITS = tuple((corner_bit, x_bit) for corner_bit, _, x_bit, _ in CORNER_PATTERN_BITS)
+
+
+def phase_index(total_pieces):
+    if total_pieces < 20:  # Opening
+        return 0
+    if total_pieces < 52:  # Mid-game
+        return 1
+    return 2  # End-game
+
+
+# phase_index by total disc count
+PHASE_BY_DISCS = tuple(phase_index(total) for total in range(65))
+
+
+def get_phase_weights(total_pieces):
+    return PHASE_WEIGHTS[phase_index(total_pieces)]
+
+
+def evaluate_bitboards(own, opp, total_pieces, depth_remaining=0, exact_stability=True, edges=None,
+                       piece_diff=None, position_score=None):
+    """Scores a position for the owner of ``own``; the core of every evaluator entry point.
+
+    exact_stability=False counts stable discs with the faster edge-only
+    rule (see othello_engine.stability). edges (the four edge pattern
+    indices with own as digit 1), piece_diff and position_score (own minus
+    opp disc count and POSITION_VALUES sum) are for callers that keep them
+    up to date; otherwise they are computed from the bitboards.
+    """
+    phase = PHASE_BY_DISCS[total_pieces]
+    phase_weights = PHASE_WEIGHTS[phase]
+    
+    score = 0
+    
+    # 1. Piece count with parity consideration
+    if piece_diff is None:
+        piece_diff = popcount(own) - popcount(opp)
+    
+    # Parity bonus in endgame
+    if total_pieces > 55:
+        remaining_moves = 64 - total_pieces
+        if remaining_moves % 2 == 1:  # Odd number of moves left
+            piece_diff += 0.5  # Slight advantage to current player
+    
+    score += phase_weights['piece'] * piece_diff
+    
+    # 2. Enhanced mobility calculation
+    my_moves = popcount(get_moves(own, opp))
+    opp_moves = popcount(get_moves(opp, own))
+    
+    if my_moves + opp_moves > 0:
+        mobility_ratio = (my_moves - opp_moves) / (my_moves + opp_moves + 1)
+        score += phase_weights['mobility'] * mobility_ratio * 100
+    
+    # Mobility desperation factor
+    if my_moves == 0 and opp_moves > 0:
+        score -= 500  # Very bad position
+    elif opp_moves == 0 and my_moves > 0:
+        score += 500  # Very good position
+    
+    # 3. Edges: corners, edge control, C-squares and walls, from the pattern tables
+    if edges is None:
+        edges = edge_indices(own, opp)
+    top, bottom, left, right = EDGE_TABLES[phase]
+    score += top[edges[0]] + bottom[edges[1]] + left[edges[2]] + right[edges[3]]
+    
+    # 4. X-squares next to empty corners
+    occupied = own | opp
+    for corner_bit, x_bit in CORNER_X_BITS:
+        if not occupied & corner_bit:
+            if own & x_bit:
+                score -= 25 + 20 * 10  # adjacency penalty and X-square pattern
+            elif opp & x_bit:
+                score += 25
+    
+    # 5. Stable discs
+    my_stable, opp_stable = stable_disc_counts(own, opp, exact_stability)
+    score += phase_weights['stability'] * (my_stable - opp_stable)
+    
+    # 6. Positional values
+    if position_score is None:
+        position_score = 0
+        for value, mask in POSITION_VALUE_MASKS.items():
+            position_score += value * (popcount(own & mask) - popcount(opp & mask))
+    score += phase_weights['position'] * position_score
+    
+    # 7. Depth bonus for deeper search
+    if depth_remaining > 0:
+        score += depth_remaining * 2
+    
+    return score
+
+def evaluate_position(position, player, depth_remaining=0, exact_stability=True):
+    """Scores a Position from player's point of view, reading its incremental features."""
+    edges = position.edges
+    if player == PLAYER_BLACK:
+        own, opp = position.black, position.white
+        piece_diff = position.black_count - position.white_count
+        position_score = position.positional
+    else:
+        own, opp = position.white, position.black
+        piece_diff = position.white_count - position.black_count
+        position_score = -position.positional
+        edges = (SWAP_DIGITS[edges[0]], SWAP_DIGITS[edges[1]], SWAP_DIGITS[edges[2]], SWAP_DIGITS[edges[3]])
+    return evaluate_bitboards(own, opp, position.black_count + position.white_count, depth_remaining,
+                              exact_stability, edges, piece_diff, position_score)
+
+def advanced_evaluate_board(board, player, total_pieces, depth_remaining=0):
+    """List-of-lists board entry point, kept for callers outside the search."""
+    black, white = board_to_bitboards(board)
+    own, opp = (black, white) if player == PLAYER_BLACK else (white, black)
+    return evaluate_bitboards(own, opp, total_pieces, depth_remaining)
+
+def pattern_score(own, opp):
+    """Evaluate common Othello patterns."""
+    score = 0
+    occupied = own | opp
+    
+    for corner_bit, _, x_bit, c_bits in CORNER_PATTERN_BITS:
+        if not occupied & corner_bit:
+            # X-square pattern (bad squares next to corners)
+            if own & x_bit:
+                score -= 20
+            # C-square pattern (squares adjacent to corners)
+            for c_bit in c_bits:
+                if own & c_bit:
+                    score -= 10
+    
+    # Wall patterns (edges controlled by one player)
+    for line in EDGE_LINE_MASKS:
+        edge_control = popcount(own & line) - popcount(opp & line)
+        if abs(edge_control) > 4:
+            score += edge_control * 5
+    
+    return score
+
+def count_advanced_stable_pieces(board, player):
+    """Number of player's discs that can never be flipped."""
+    black, white = board_to_bitboards(board)
+    own, opp = (black, white) if player == PLAYER_BLACK else (white, black)
+    return popcount(stable_discs(own, opp))
+
+def evaluate_patterns(board, player):
+    """Evaluate common Othello patterns."""
+    black, white = board_to_bitboards(board)
+    own, opp = (black, white) if player == PLAYER_BLACK else (white, black)
+    return pattern_score(own, opp)
@@ -0,0 +1,161 @@
+import copy
+import time
+from collections.abc import Mapping
+
+from .bitboard import get_flips, get_moves, iter_squares, mask_to_positions, popcount, square_index
+from .constants import EMPTY, PLAYER_BLACK, PLAYER_WHITE
+from .geometry import CORNER_MASK, EDGE_MASK
+from .position import Position
+
+
+class LegalMoves(Mapping):
+    """Legal moves of one side, read-only {(r, c): [flipped (r, c), ...]}.
+
+    Legality, membership, iteration and len() only use the move mask; a
+    flip list is computed the first time that move is looked up, so code
+    that only counts or lists moves never builds one.
+    """
+
+    __slots__ = ('own', 'opp', 'mask', '_flips')
+
+    def __init__(self, own, opp):
+        self.own = own
+        self.opp = opp
+        self.mask = get_moves(own, opp)
+        self._flips = {}
+
+    def __contains__(self, pos):
+        r, c = pos
+        return 0 <= r < 8 and 0 <= c < 8 and bool(self.mask >> (r * 8 + c) & 1)
+
+    def __getitem__(self, pos):
+        flips = self._flips.get(pos)
+        if flips is None:
+            if pos not in self:
+                raise KeyError(pos)
+            flips = mask_to_positions(get_flips(self.own, self.opp, square_index(*pos)))
+            self._flips[pos] = flips
+        return flips
+
+    def __iter__(self):
+        for sq in iter_squares(self.mask):
+            yield divmod(sq, 8)
+
+    def __len__(self):
+        return popcount(self.mask)
+
+    def __repr__(self):
+        return f"LegalMoves({list(self)})"
+
+
+class Othello:
+    """Rules, bitboards and move history for one game; no rendering or sound.
+
+    The game state proper is a Position; the list-of-lists board is kept in
+    step with it for the UI and the move history.
+    """
+
+    def __init__(self):
+        self.position = Position()
+        self.board = self.position.to_board()
+        self.valid_moves = self.get_valid_moves(self.current_player)
+        self.move_history = []
+        self.game_history = []  # Full game history with timestamps
+        self.last_move = None
+        self.game_over = False
+        self.winner = None
+        self.turn_count = 0
+        self.move_start_time = time.time()
+        
+    @property
+    def current_player(self):
+        return self.position.side
+
+    def copy(self):
+        """Creates a deep copy for AI simulation."""
+        new_game = Othello()
+        new_game.position = self.position.copy()
+        new_game.board = copy.deepcopy(self.board)
+        new_game.valid_moves = new_game.get_valid_moves(new_game.current_player)
+        new_game.turn_count = self.turn_count
+        return new_game
+
+    def is_on_board(self, r, c):
+        return 0 <= r < 8 and 0 <= c < 8
+
+    def _get_bitboards(self, player):
+        """Returns (own, opponent) bitboards for the given player."""
+        return self.position.bitboards(player)
+
+    def get_valid_moves(self, player):
+        """Returns a LegalMoves mapping; flip lists are built only on lookup."""
+        return LegalMoves(*self._get_bitboards(player))
+
+    def get_legal_mask(self, player):
+        """Legality only: the bitboard of squares where player can move."""
+        own, opp = self._get_bitboards(player)
+        return get_moves(own, opp)
+
+    def _get_pieces_to_flip(self, r, c, player):
+        own, opp = self._get_bitboards(player)
+        return mask_to_positions(get_flips(own, opp, square_index(r, c)))
+
+    def make_move(self, r, c):
+        if (r, c) in self.valid_moves:
+            player = self.current_player
+            # Record move in history
+            move_time = time.time() - self.move_start_time
+            self.game_history.append({
+                'move': (r, c),
+                'player': player,
+                'turn': self.turn_count,
+                'time': move_time,
+                'board_state': copy.deepcopy(self.board)
+            })
+            
+            self.move_history.append(copy.deepcopy(self.board))
+            flips = self.position.apply_move(square_index(r, c))[1]
+            self.board[r][c] = player
+            for flip_sq in iter_squares(flips):
+                self.board[flip_sq >> 3][flip_sq & 7] = player
+            self.last_move = (r, c)
+            self.turn_count += 1
+
+            self._switch_player()
+            return True
+        return False
+
+    def _switch_player(self):
+        """Settles whose turn it is after the position has handed over the move."""
+        self.valid_moves = self.get_valid_moves(self.current_player)
+        self.move_start_time = time.time()
+        
+        if not self.valid_moves.mask:
+            self.position.apply_pass()
+            self.valid_moves = self.get_valid_moves(self.current_player)
+            if not self.valid_moves.mask:
+                self.game_over = True
+                self._determine_winner()
+
+    def get_score(self):
+        return self.position.black_count, self.position.white_count
+
+    def _determine_winner(self):
+        black_score, white_score = self.get_score()
+        if black_score > white_score:
+            self.winner = PLAYER_BLACK
+        elif white_score > black_score:
+            self.winner = PLAYER_WHITE
+        else:
+            self.winner = EMPTY
+
+    def get_mobility_score(self, player):
+        return popcount(self.get_legal_mask(player))
+
+    def get_corner_score(self, player):
+        own, _ = self._get_bitboards(player)
+        return popcount(own & CORNER_MASK)
+
+    def get_edge_score(self, player):
+        own, _ = self._get_bitboards(player)
+        return popcount(own & EDGE_MASK)
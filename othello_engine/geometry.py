@@ -0,0 +1,113 @@
+"""Board geometry index, built once at import.
+
+Everything the move generator, the stability count and the pattern
+evaluator used to recompute per call: the ray of squares in each direction
+from every square and edge/corner/region membership, as masks.
+Squares are indexed ``r * 8 + c``; the ``*_CELLS`` tables hold the same
+squares as (r, c) pairs for code that reads the list-of-lists board.
+"""
+
+from .constants import DIRECTIONS, POSITION_VALUES
+
+# =============================================================================
+# 1. Rays
+# =============================================================================
+
+def _on_board(r, c):
+    return 0 <= r < 8 and 0 <= c < 8
+
+
+def _build_ray(sq, dr, dc):
+    r, c = divmod(sq, 8)
+    ray = []
+    r, c = r + dr, c + dc
+    while _on_board(r, c):
+        ray.append(r * 8 + c)
+        r, c = r + dr, c + dc
+    return tuple(ray)
+
+
+def _to_mask(squares):
+    mask = 0
+    for sq in squares:
+        mask |= 1 << sq
+    return mask
+
+
+SQUARE_CELLS = tuple(divmod(sq, 8) for sq in range(64))
+
+# RAYS[sq][d]: squares walked from sq in DIRECTIONS[d], nearest first
+RAYS = tuple(tuple(_build_ray(sq, dr, dc) for dr, dc in DIRECTIONS) for sq in range(64))
+
+# Ray masks split by whether the direction walks towards higher square
+# indices (nearest blocker = lowest set bit) or lower ones (highest set bit).
+# Rays shorter than two squares can never flip anything and are left out.
+RAY_MASKS_UP = tuple(
+    tuple(_to_mask(ray) for (dr, dc), ray in zip(DIRECTIONS, RAYS[sq]) if dr * 8 + dc > 0 and len(ray) > 1)
+    for sq in range(64)
+)
+RAY_MASKS_DOWN = tuple(
+    tuple(_to_mask(ray) for (dr, dc), ray in zip(DIRECTIONS, RAYS[sq]) if dr * 8 + dc < 0 and len(ray) > 1)
+    for sq in range(64)
+)
+
+# =============================================================================
+# 2. Edges, Corners and Regions
+# =============================================================================
+
+CORNER_CELLS = ((0, 0), (0, 7), (7, 0), (7, 7))
+# Per corner, in CORNER_CELLS order: its C-squares and its X-square.
+C_SQUARE_CELLS = (((0, 1), (1, 0)), ((0, 6), (1, 7)), ((6, 0), (7, 1)), ((6, 7), (7, 6)))
+X_SQUARE_CELLS = ((1, 1), (1, 6), (6, 1), (6, 6))
+# C-squares then X-square, the order the evaluator applies adjacency penalties in.
+CORNER_ADJACENT_CELLS = tuple(c_cells + (x_cell,) for c_cells, x_cell in zip(C_SQUARE_CELLS, X_SQUARE_CELLS))
+
+EDGE_LINE_CELLS = (
+    tuple((0, c) for c in range(8)),  # top
+    tuple((7, c) for c in range(8)),  # bottom
+    tuple((r, 0) for r in range(8)),  # left
+    tuple((r, 7) for r in range(8)),  # right
+)
+# All 28 perimeter squares, each once
+EDGE_CELLS = tuple(sorted({cell for line in EDGE_LINE_CELLS for cell in line}))
+
+CORNER_SQUARES = tuple(r * 8 + c for r, c in CORNER_CELLS)
+
+# Quadrants, used for parity: 0 top-left, 1 top-right, 2 bottom-left, 3 bottom-right
+REGION = tuple((r >= 4) * 2 + (c >= 4) for r, c in SQUARE_CELLS)
+REGION_MASKS = tuple(_to_mask(sq for sq in range(64) if REGION[sq] == region) for region in range(4))
+
+CORNER_MASK = _to_mask(CORNER_SQUARES)
+# Per corner: (corner bit, C-square and X-square bits in CORNER_ADJACENT_CELLS
+# order, X-square bit, C-square bits)
+CORNER_PATTERN_BITS = tuple(
+    (1 << (r * 8 + c),
+     tuple(1 << (ar * 8 + ac) for ar, ac in adjacent),
+     1 << (xr * 8 + xc),
+     tuple(1 << (cr * 8 + cc) for cr, cc in c_cells))
+    for (r, c), adjacent, (xr, xc), c_cells in zip(CORNER_CELLS, CORNER_ADJACENT_CELLS, X_SQUARE_CELLS, C_SQUARE_CELLS)
+)
+EDGE_MASK = _to_mask(r * 8 + c for r, c in EDGE_CELLS)
+EDGE_LINE_MASKS = tuple(_to_mask(r * 8 + c for r, c in line) for line in EDGE_LINE_CELLS)
+
+POSITION_VALUE = tuple(POSITION_VALUES[r][c] for r, c in SQUARE_CELLS)
+# value -> mask of squares carrying that positional value
+POSITION_VALUE_MASKS = {}
+for _sq, _value in enumerate(POSITION_VALUE):
+    POSITION_VALUE_MASKS[_value] = POSITION_VALUE_MASKS.get(_value, 0) | (1 << _sq)
+
+# =============================================================================
+# 3. Lines
+# =============================================================================
+
+# Every full board line along each of the four axes: rows, columns,
+# diagonals (down-right) and anti-diagonals (down-left)
+ROW_LINE_MASKS = tuple(_to_mask(r * 8 + c for c in range(8)) for r in range(8))
+COLUMN_LINE_MASKS = tuple(_to_mask(r * 8 + c for r in range(8)) for c in range(8))
+DIAGONAL_LINE_MASKS = tuple(_to_mask(r * 8 + c for r, c in SQUARE_CELLS if c - r == k) for k in range(-7, 8))
+ANTI_DIAGONAL_LINE_MASKS = tuple(_to_mask(r * 8 + c for r, c in SQUARE_CELLS if r + c == k) for k in range(15))
+
+# Squares missing a neighbour on one side of an axis
+WEST_EAST_BORDER = COLUMN_LINE_MASKS[0] | COLUMN_LINE_MASKS[7]
+NORTH_SOUTH_BORDER = ROW_LINE_MASKS[0] | ROW_LINE_MASKS[7]
+BORDER_MASK = WEST_EAST_BORDER | NORTH_SOUTH_BORDER
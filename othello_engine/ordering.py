@@ -0,0 +1,74 @@
+"""Move ordering state learned during a search.
+
+Alpha-beta prunes best when the best move is tried first. Besides the
+static hints (corners, flips, POSITION_VALUES) the search orders moves by:
+
+1. the transposition-table move (or, without one, the best move of a
+   shallower internal iterative deepening search),
+2. killer moves: quiet moves that caused a cutoff at the same ply,
+3. the history table: how often a square caused cutoffs for that side,
+   weighted by depth squared.
+"""
+
+from .bitboard import popcount
+from .constants import CORNER_SQUARES, PLAYER_BLACK, POSITION_VALUES
+
+HASH_MOVE_BONUS = 1000000
+KILLER_BONUS = (50000, 40000)
+# Corners rank above history scores; the rest is history plus static hints
+CORNER_BONUS = 30000
+MAX_PLY = 64
+
+
+class MoveOrdering:
+    """Killer slots per ply and a history table per side and square."""
+
+    __slots__ = ('killers', 'history')
+
+    def __init__(self):
+        self.killers = [[None, None] for _ in range(MAX_PLY + 1)]
+        self.history = ([0] * 64, [0] * 64)
+
+    def clear(self):
+        for slots in self.killers:
+            slots[0] = slots[1] = None
+        for table in self.history:
+            table[:] = [0] * 64
+
+    def age(self, plies):
+        """Carries the tables over to a search rooted plies moves later.
+
+        Killers move up with the root and history scores are halved, so
+        they still guide the first iterations but soon give way to new ones.
+        """
+        self.killers = self.killers[plies:] + [[None, None] for _ in range(min(plies, MAX_PLY + 1))]
+        for table in self.history:
+            table[:] = [score >> 1 for score in table]
+
+    def score_moves(self, candidates, side, ply, hash_move):
+        """Returns [(score, sq, flips)] for (sq, flips) candidates, best first."""
+        history = self.history[side != PLAYER_BLACK]
+        killer_1, killer_2 = self.killers[ply]
+        scored = []
+        for sq, flips in candidates:
+            if sq == hash_move:
+                score = HASH_MOVE_BONUS
+            elif sq == killer_1:
+                score = KILLER_BONUS[0]
+            elif sq == killer_2:
+                score = KILLER_BONUS[1]
+            else:
+                score = history[sq] + popcount(flips) * 10 + POSITION_VALUES[sq >> 3][sq & 7]
+                if sq in CORNER_SQUARES:
+                    score += CORNER_BONUS
+            scored.append((score, sq, flips))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return scored
+
+    def record_cutoff(self, sq, side, ply, depth):
+        """Credits sq with a beta cutoff at this ply and remaining depth."""
+        slots = self.killers[ply]
+        if slots[0] != sq:
+            slots[1] = slots[0]
+            slots[0] = sq
+        self.history[side != PLAYER_BLACK][sq] += depth * depth
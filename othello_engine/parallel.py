@@ -0,0 +1,159 @@
+"""Root-split parallel search over a process pool.
+
+Each root move is searched in a worker process with the serial
+enhanced_minimax_alphabeta, so the GIL no longer limits the AI to one core.
+The first (expected best) move of every iteration is searched on its own to
+set a bound; the remaining moves then run in parallel and read the best
+score found so far from a shared value as their alpha, so moves that finish
+late prune against the ones that finished early.
+
+Run ``python -m othello_engine.parallel`` for a speedup report.
+"""
+
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .bitboard import iter_squares
+from .constants import POSITION_VALUES
+from .ordering import MoveOrdering
+from .search import TT_SIZE_MB, SearchTimeout, enhanced_minimax_alphabeta, iterative_deepening
+from .transposition import TranspositionTable
+
+# =============================================================================
+# 1. Worker Side
+# =============================================================================
+
+_shared_alpha = None
+# (search id, table, ordering): each worker keeps its own for the whole of a search
+_worker_state = (None, None, None)
+
+
+def _init_worker(shared_alpha):
+    global _shared_alpha
+    _shared_alpha = shared_alpha
+
+
+def _search_root_move(search_id, position, sq, depth, ai_player, start_time, time_limit, tt_size_mb):
+    """Searches one root move; returns (sq, score) or (sq, None) on timeout."""
+    global _worker_state
+    if _worker_state[0] != search_id:
+        _worker_state = (search_id, TranspositionTable(tt_size_mb), MoveOrdering())
+    _, tt, ordering = _worker_state
+
+    position.apply_move(sq)
+    alpha = _shared_alpha.value
+    try:
+        score, _, _ = enhanced_minimax_alphabeta(position, depth - 1, alpha, math.inf, False, ai_player,
+                                                 start_time, time_limit, tt, ply=1, ordering=ordering)
+    except SearchTimeout:
+        return sq, None
+
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return sq, score
+
+
+# =============================================================================
+# 2. Parallel Search Driver
+# =============================================================================
+
+class ParallelSearch:
+    """Process pool plus the shared alpha bound, reused across searches.
+
+    Workers are started with the ``spawn`` method so forking never copies
+    the pygame/SDL state of the UI process.
+    """
+
+    def __init__(self, workers=None, tt_size_mb=TT_SIZE_MB):
+        self.workers = workers or os.cpu_count() or 1
+        self.tt_size_mb = max(1, tt_size_mb // self.workers)
+        context = multiprocessing.get_context('spawn')
+        self.shared_alpha = context.Value('d', -math.inf)
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker,
+                                            initargs=(self.shared_alpha,))
+        self._search_id = 0
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit(self, position, sq, depth, ai_player, start_time, time_limit):
+        return self.executor.submit(_search_root_move, self._search_id, position, sq, depth, ai_player,
+                                    start_time, time_limit, self.tt_size_mb)
+
+    def search(self, position, max_depth, ai_player, start_time, time_limit):
+        """Iterative deepening with every iteration split at the root.
+
+        Same contract as iterative_deepening: returns (score, best_move,
+        evaluated_moves, depth) of the deepest completed iteration.
+        """
+        root_moves = list(iter_squares(position.legal_moves()))
+        if len(root_moves) <= 1:
+            return iterative_deepening(position, max_depth, ai_player, start_time, time_limit)
+
+        self._search_id += 1
+        order = sorted(root_moves, key=lambda sq: POSITION_VALUES[sq >> 3][sq & 7], reverse=True)
+        result = None
+        for depth in range(1, max_depth + 1):
+            limit = math.inf if depth == 1 else time_limit
+            self.shared_alpha.value = -math.inf
+
+            first = self._submit(position, order[0], depth, ai_player, start_time, limit)
+            completed = [first.result()]
+            if completed[0][1] is not None:
+                futures = [self._submit(position, sq, depth, ai_player, start_time, limit) for sq in order[1:]]
+                completed += [future.result() for future in futures]
+            if any(score is None for _, score in completed):
+                break
+
+            # Stable sort: ties keep search order, as in the serial search
+            evaluated_moves = sorted(((score, divmod(sq, 8)) for sq, score in completed),
+                                     key=lambda x: x[0], reverse=True)
+            result = (evaluated_moves[0][0], evaluated_moves[0][1], evaluated_moves, depth)
+            order = [r * 8 + c for _, (r, c) in evaluated_moves]
+
+        return result
+
+
+_searches = {}
+
+
+def get_parallel_search(workers):
+    """Returns the shared ParallelSearch for this worker count, starting it on first use."""
+    if workers not in _searches:
+        _searches[workers] = ParallelSearch(workers)
+    return _searches[workers]
+
+
+# =============================================================================
+# 3. Speedup Report
+# =============================================================================
+
+def _speedup_report(depth=8, worker_counts=(1, 2, 4, 8, 16)):
+    from .game import Othello
+
+    game = Othello()
+    for move in [(2, 3), (2, 2), (2, 1), (4, 2), (5, 5), (3, 2)]:
+        game.make_move(*move)
+    print(f"{os.cpu_count()} CPUs, depth {depth}")
+
+    start = time.time()
+    serial = iterative_deepening(game.position, depth, game.current_player, start, math.inf)
+    serial_time = time.time() - start
+    print(f"serial      {serial_time:7.2f}s  best {serial[1]}")
+
+    for workers in worker_counts:
+        search = ParallelSearch(workers)
+        search.search(game.position, 1, game.current_player, time.time(), math.inf)  # start the pool
+        start = time.time()
+        result = search.search(game.position, depth, game.current_player, start, math.inf)
+        elapsed = time.time() - start
+        search.shutdown()
+        print(f"{workers:2d} workers  {elapsed:7.2f}s  best {result[1]}  speedup {serial_time / elapsed:.2f}x")
+
+
+if __name__ == '__main__':
+    _speedup_report()
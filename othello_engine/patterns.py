@@ -0,0 +1,93 @@
+"""Base-3 edge pattern tables.
+
+Each board edge is read as an 8-digit base-3 number, one digit per square
+along the edge (0 empty, 1 the player being scored, 2 the opponent), so an
+edge configuration is an index in range(6561). Every edge-only term of the
+evaluator (edge discs, corners, C-square penalties and wall patterns) is
+summed once per index and phase into a lookup table; scoring an edge is
+then one list index instead of a loop over its squares. X-squares lie off
+the edges and are scored separately.
+
+Positions keep their edge indices up to date as discs are placed and
+flipped (see EDGE_SQUARE_WEIGHTS); evaluate_bitboards computes them from
+the masks with edge_indices. The tables are built from the phase weights
+at import, and could just as well be filled with tuned values.
+"""
+
+from .geometry import EDGE_LINE_CELLS
+
+EDGE_PATTERN_SIZE = 3 ** 8
+
+# Squares of each edge in digit order: top, bottom, left, right as in
+# EDGE_LINE_CELLS. Digit 0 and digit 7 are corners, 1 and 6 C-squares.
+EDGE_PATTERN_SQUARES = tuple(tuple(r * 8 + c for r, c in line) for line in EDGE_LINE_CELLS)
+# Edges whose table also scores the corners (the others would count them twice)
+CORNER_EDGES = (0, 1)
+
+# EDGE_SQUARE_WEIGHTS[sq]: (edge, 3 ** digit) for every edge sq lies on
+EDGE_SQUARE_WEIGHTS = tuple(
+    tuple((edge, 3 ** line.index(sq)) for edge, line in enumerate(EDGE_PATTERN_SQUARES) if sq in line)
+    for sq in range(64)
+)
+
+# TERNARY[bits]: the base-3 number with digit 1 wherever the 8-bit mask has a 1
+TERNARY = tuple(sum(3 ** k for k in range(8) if bits >> k & 1) for bits in range(256))
+# SWAP_DIGITS[index]: the same edge seen by the other player (digits 1 and 2 swapped)
+SWAP_DIGITS = tuple(
+    sum((3 - digit if digit else 0) * 3 ** k for k, digit in enumerate(
+        (index // 3 ** k) % 3 for k in range(8)))
+    for index in range(EDGE_PATTERN_SIZE)
+)
+
+_COL0 = 0x0101010101010101
+_COLUMN_GATHER = 0x0102040810204080  # column-0 bits -> top byte, row k at bit k
+
+
+def edge_indices(own, opp):
+    """Base-3 indices of the four edges with own as digit 1."""
+    own_left = ((own & _COL0) * _COLUMN_GATHER >> 56) & 0xFF
+    opp_left = ((opp & _COL0) * _COLUMN_GATHER >> 56) & 0xFF
+    own_right = (((own >> 7) & _COL0) * _COLUMN_GATHER >> 56) & 0xFF
+    opp_right = (((opp >> 7) & _COL0) * _COLUMN_GATHER >> 56) & 0xFF
+    return (TERNARY[own & 0xFF] + 2 * TERNARY[opp & 0xFF],
+            TERNARY[own >> 56] + 2 * TERNARY[opp >> 56],
+            TERNARY[own_left] + 2 * TERNARY[opp_left],
+            TERNARY[own_right] + 2 * TERNARY[opp_right])
+
+
+def _edge_score(digits, weights, with_corners):
+    """The evaluator's edge-only terms for one edge, own digit 1."""
+    own = digits.count(1)
+    opp = digits.count(2)
+    score = 0
+
+    # Corner adjacency and C-square patterns, for C-squares next to an empty corner
+    for corner, c_square in ((0, 1), (7, 6)):
+        if digits[corner] == 0:
+            if digits[c_square] == 1:
+                score -= 25 + 10 * 10
+            elif digits[c_square] == 2:
+                score += 25
+
+    # Wall pattern
+    if abs(own - opp) > 4:
+        score += (own - opp) * 5 * 10
+
+    corner_diff = (digits[0] == 1) + (digits[7] == 1) - (digits[0] == 2) - (digits[7] == 2)
+    inner_diff = digits[1:7].count(1) - digits[1:7].count(2)
+    if with_corners:
+        score += weights['corner'] * corner_diff + weights['edge'] * (inner_diff + corner_diff)
+    else:
+        score += weights['edge'] * inner_diff
+    return score
+
+
+def build_edge_tables(phase_weights):
+    """One (top, bottom, left, right) tuple of score tables per phase weight dict."""
+    all_digits = [tuple((index // 3 ** k) % 3 for k in range(8)) for index in range(EDGE_PATTERN_SIZE)]
+    tables = []
+    for weights in phase_weights:
+        corner_table = [_edge_score(digits, weights, True) for digits in all_digits]
+        side_table = [_edge_score(digits, weights, False) for digits in all_digits]
+        tables.append(tuple(corner_table if edge in CORNER_EDGES else side_table for edge in range(4)))
+    return tuple(tables)
@@ -0,0 +1,112 @@
+"""Pondering: searching on the opponent's time.
+
+While the human is to move, a background thread searches the position
+after each of their possible replies, likeliest first, one depth at a time
+across all replies. Every finished (reply, depth) search is kept, and all
+of them share one transposition table. When the human moves, take() stops
+the thread and hands over what was found for the move actually played:
+a result deep enough answers straight away, otherwise the table lets the
+real search redo the shallow iterations almost for free.
+"""
+
+import math
+import threading
+import time
+
+from .bitboard import iter_squares
+from .constants import WLD_EMPTIES
+from .evaluation import evaluate_position
+from .ordering import MoveOrdering
+from .search import TT_SIZE_MB, enhanced_minimax_alphabeta, search_settings
+from .timecontrol import SearchClock, SearchTimeout
+from .transposition import TranspositionTable
+
+
+class Ponderer:
+    """Background search of the opponent's replies, one position at a time."""
+
+    def __init__(self):
+        self.position = None
+        self.results = {}  # reply square -> (score, best_move, evaluated_moves, depth)
+        self.tt = None
+        self.ordering = None
+        self.complete = False  # every reply searched to full depth
+        self._clock = None
+        self._thread = None
+
+    @property
+    def active(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, position, ai_player, difficulty, tt=None, ordering=None, expected=None, eval_cache=None):
+        """Ponders position (the opponent to move) for ai_player; a no-op if already doing so.
+
+        tt and ordering, if given, are filled instead of fresh ones (see
+        othello_engine.engine), as is eval_cache. expected, a reply square,
+        is searched first.
+        """
+        if self.position is not None and self.position == position and (self.active or self.complete):
+            return
+        self.stop()
+        if position.empties - 1 <= WLD_EMPTIES[difficulty]:
+            return  # the endgame solver takes over from here
+        self.position = position.copy()
+        self.results = {}
+        self.complete = False
+        self.tt = TranspositionTable(TT_SIZE_MB) if tt is None else tt
+        self.ordering = MoveOrdering() if ordering is None else ordering
+        self._clock = SearchClock(time.time(), math.inf)
+        max_depth, probcut = search_settings(difficulty)
+        self._thread = threading.Thread(target=self._run, args=(self.position.copy(), ai_player, max_depth,
+                                                                probcut, self._clock, expected, eval_cache),
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Cancels the background search and waits for it to unwind."""
+        if self._clock is not None:
+            self._clock.stop()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def take(self, position):
+        """Stops pondering; returns (result, tt, ordering) if position follows a pondered reply, else None.
+
+        result is the deepest finished search of that reply, or None if
+        none finished yet.
+        """
+        self.stop()
+        if self.position is None:
+            return None
+        pondered, self.position = self.position, None
+        for sq in iter_squares(pondered.legal_moves()):
+            child = pondered.copy()
+            child.apply_move(sq)
+            if child == position:
+                return self.results.get(sq), self.tt, self.ordering
+        return None
+
+    def _run(self, position, ai_player, max_depth, probcut, clock, expected, eval_cache):
+        # Likeliest replies first: the expected one, then best for the
+        # opponent by static evaluation
+        replies = []
+        for sq in iter_squares(position.legal_moves()):
+            child = position.copy()
+            child.apply_move(sq)
+            if child.legal_moves():
+                replies.append((evaluate_position(child, ai_player), sq, child))
+        replies.sort(key=lambda reply: (reply[1] != expected, reply[0]))
+
+        try:
+            for depth in range(1, max_depth + 1):
+                for _, sq, child in replies:
+                    score, best_move, evaluated_moves = enhanced_minimax_alphabeta(
+                        child.copy(), depth, -math.inf, math.inf, True, ai_player, clock.start_time,
+                        clock.time_limit, self.tt, ordering=self.ordering, probcut=probcut, clock=clock,
+                        eval_cache=eval_cache
+                    )
+                    self.results[sq] = (score, best_move, evaluated_moves, depth)
+        except SearchTimeout:
+            return
+        self.complete = True
@@ -0,0 +1,149 @@
+from .bitboard import board_to_bitboards, get_flips, get_moves, iter_squares, popcount
+from .constants import EMPTY, PLAYER_BLACK, PLAYER_WHITE
+from .geometry import POSITION_VALUE
+from .patterns import EDGE_SQUARE_WEIGHTS, edge_indices
+from .transposition import ZOBRIST_BLACK, ZOBRIST_FLIP, ZOBRIST_SIDE, ZOBRIST_WHITE, compute_hash
+
+START_BLACK = (1 << 28) | (1 << 35)  # (3, 4), (4, 3)
+START_WHITE = (1 << 27) | (1 << 36)  # (3, 3), (4, 4)
+
+
+class Position:
+    """Compact search position: both bitboards, side to move, hash and disc counts.
+
+    This is all the search and the evaluator need, so it is cheap to build,
+    copy and pickle to worker processes. Moves are square indices
+    (``r * 8 + c``); apply_move/undo_move change the position in place.
+    edges holds the four edge pattern indices (see othello_engine.patterns)
+    with black as digit 1, and positional the POSITION_VALUES sum of black's
+    discs minus white's; both are updated square by square as discs change.
+    """
+
+    __slots__ = ('black', 'white', 'side', 'hash', 'black_count', 'white_count', 'edges', 'positional')
+
+    def __init__(self, black=START_BLACK, white=START_WHITE, side=PLAYER_BLACK, hash=None, edges=None,
+                 positional=None):
+        self.black = black
+        self.white = white
+        self.side = side
+        self.hash = compute_hash(black, white, side == PLAYER_WHITE) if hash is None else hash
+        self.black_count = popcount(black)
+        self.white_count = popcount(white)
+        self.edges = list(edge_indices(black, white)) if edges is None else edges[:]
+        if positional is None:
+            positional = (sum(POSITION_VALUE[sq] for sq in iter_squares(black))
+                          - sum(POSITION_VALUE[sq] for sq in iter_squares(white)))
+        self.positional = positional
+
+    @classmethod
+    def from_board(cls, board, side):
+        black, white = board_to_bitboards(board)
+        return cls(black, white, side)
+
+    def copy(self):
+        return Position(self.black, self.white, self.side, self.hash, self.edges, self.positional)
+
+    def to_board(self):
+        board = [[EMPTY] * 8 for _ in range(8)]
+        for sq in iter_squares(self.black):
+            board[sq >> 3][sq & 7] = PLAYER_BLACK
+        for sq in iter_squares(self.white):
+            board[sq >> 3][sq & 7] = PLAYER_WHITE
+        return board
+
+    def __eq__(self, other):
+        return (isinstance(other, Position) and self.black == other.black
+                and self.white == other.white and self.side == other.side)
+
+    def __hash__(self):
+        return self.hash
+
+    def __repr__(self):
+        side = "black" if self.side == PLAYER_BLACK else "white"
+        return f"Position(black={self.black:#018x}, white={self.white:#018x}, {side} to move)"
+
+    @property
+    def total_discs(self):
+        return self.black_count + self.white_count
+
+    @property
+    def empties(self):
+        return 64 - self.black_count - self.white_count
+
+    def bitboards(self, player):
+        """Returns (own, opponent) bitboards for the given player."""
+        if player == PLAYER_BLACK:
+            return self.black, self.white
+        return self.white, self.black
+
+    def legal_moves(self):
+        """Mask of squares where the side to move can play."""
+        if self.side == PLAYER_BLACK:
+            return get_moves(self.black, self.white)
+        return get_moves(self.white, self.black)
+
+    def is_game_over(self):
+        return not get_moves(self.black, self.white) and not get_moves(self.white, self.black)
+
+    def apply_move(self, sq, flips=None):
+        """Plays sq for the side to move in place and returns an undo record."""
+        bit = 1 << sq
+        key = self.hash ^ ZOBRIST_SIDE
+        old_edges = self.edges
+        self.edges = edges = old_edges[:]
+        if self.side == PLAYER_BLACK:
+            placed_digit, flip_delta = 1, -1  # empty -> 1, 2 -> 1
+            if flips is None:
+                flips = get_flips(self.black, self.white, sq)
+            count = popcount(flips)
+            self.black |= flips | bit
+            self.white ^= flips
+            self.black_count += count + 1
+            self.white_count -= count
+            key ^= ZOBRIST_BLACK[sq]
+            value_sign = 1
+        else:
+            placed_digit, flip_delta = 2, 1  # empty -> 2, 1 -> 2
+            if flips is None:
+                flips = get_flips(self.white, self.black, sq)
+            count = popcount(flips)
+            self.white |= flips | bit
+            self.black ^= flips
+            self.white_count += count + 1
+            self.black_count -= count
+            key ^= ZOBRIST_WHITE[sq]
+            value_sign = -1
+        for edge, weight in EDGE_SQUARE_WEIGHTS[sq]:
+            edges[edge] += placed_digit * weight
+        gained = POSITION_VALUE[sq]
+        for flip_sq in iter_squares(flips):
+            key ^= ZOBRIST_FLIP[flip_sq]
+            gained += 2 * POSITION_VALUE[flip_sq]  # leaves one side, joins the other
+            for edge, weight in EDGE_SQUARE_WEIGHTS[flip_sq]:
+                edges[edge] += flip_delta * weight
+
+        undo = (sq, flips, self.hash, old_edges, self.positional)
+        self.positional += value_sign * gained
+        self.hash = key
+        self.side = -self.side
+        return undo
+
+    def undo_move(self, undo):
+        sq, flips, self.hash, self.edges, self.positional = undo
+        self.side = mover = -self.side
+        count = popcount(flips)
+        if mover == PLAYER_BLACK:
+            self.black &= ~(flips | (1 << sq))
+            self.white |= flips
+            self.black_count -= count + 1
+            self.white_count += count
+        else:
+            self.white &= ~(flips | (1 << sq))
+            self.black |= flips
+            self.white_count -= count + 1
+            self.black_count += count
+
+    def apply_pass(self):
+        """Hands the move to the other side; calling it again undoes it."""
+        self.side = -self.side
+        self.hash ^= ZOBRIST_SIDE
@@ -0,0 +1,158 @@
+"""Multi-ProbCut: statistical forward pruning from shallow searches.
+
+The score v of a depth-d search is well predicted by the score v' of a
+shallow search of the same position: v ~ slope * v' + offset, with normal
+error of deviation sigma. So a node is cut without the deep search when
+the shallow one says, with confidence threshold (in sigmas), that v falls
+outside the window:
+
+    v' >= (beta + t * sigma - offset) / slope   -> fail high
+    v' <= (alpha - t * sigma - offset) / slope  -> fail low
+
+Both tests are null-window searches at the shallow depth, run only at
+null-window nodes below the root. Smaller thresholds cut more and err
+more often. The regression parameters depend
+on the depth and the game phase and are fitted from self-play with
+
+    python -m othello_engine.probcut [games] [max_depth]
+
+which prints a new MPC_PARAMS table to paste below.
+"""
+
+import math
+import random
+import sys
+import time
+
+from .evaluation import phase_index
+from .ordering import MoveOrdering
+from .position import Position
+from .timecontrol import SearchClock
+from .transposition import TranspositionTable
+
+MPC_MIN_DEPTH = 3
+
+
+def shallow_depth(depth):
+    """Depth of the predicting search for a depth-`depth` node."""
+    return depth - 2 if depth < 6 else depth - 4
+
+
+# MPC_PARAMS[depth]: (slope, offset, sigma) per phase (opening, midgame,
+# endgame) relating shallow_depth(depth) scores to depth scores. Deeper
+# nodes use the deepest fitted entry. Fitted from 795 positions from 60 games, 804s.
+MPC_PARAMS = {
+    3: ((0.771, 59.0, 192.5), (1.063, 103.2, 505.1), (1.067, -11.9, 1250.7)),
+    4: ((0.838, 8.8, 113.3), (1.073, 68.4, 566.3), (1.12, 186.7, 1032.1)),
+    5: ((0.847, -23.9, 111.4), (1.078, 43.1, 488.9), (1.113, 87.0, 1008.2)),
+    6: ((0.79, 22.2, 139.4), (1.165, 89.6, 827.1), (1.204, 316.4, 1828.5)),
+    7: ((0.793, -28.7, 117.3), (1.166, 83.7, 779.5), (1.207, 121.7, 1592.1)),
+}
+
+
+class MultiProbCut:
+    """Regression table plus the confidence threshold of one search."""
+
+    __slots__ = ('threshold', 'params', 'max_depth', 'cuts')
+
+    def __init__(self, threshold, params=None):
+        self.threshold = threshold
+        self.params = MPC_PARAMS if params is None else params
+        self.max_depth = max(self.params, default=0)
+        self.cuts = 0
+
+    def check(self, depth, total_discs):
+        """(shallow depth, slope, offset, sigma) for a node, or None for no test."""
+        if depth < MPC_MIN_DEPTH or not self.params:
+            return None
+        fitted = self.params.get(min(depth, self.max_depth))
+        if fitted is None:
+            return None
+        return (shallow_depth(depth),) + fitted[phase_index(total_discs)]
+
+
+# =============================================================================
+# Fitting
+# =============================================================================
+
+def self_play_positions(games, seed=0, random_share=0.25, min_empties=8):
+    """Positions from quick depth-2 self-play games, randomised for variety."""
+    from .search import iterative_deepening  # imports this module
+
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(games):
+        position = Position()
+        while not position.is_game_over():
+            moves = position.legal_moves()
+            if not moves:
+                position.apply_pass()
+                continue
+            if position.empties >= min_empties:
+                positions.append(position.copy())
+            squares = [sq for sq in range(64) if moves >> sq & 1]
+            if rng.random() < random_share:
+                sq = rng.choice(squares)
+            else:
+                row, col = iterative_deepening(position, 2, position.side, time.time(), math.inf)[1]
+                sq = row * 8 + col
+            position.apply_move(sq)
+    return positions
+
+
+def _regress(pairs):
+    """Least-squares (slope, offset, sigma) of deep on shallow scores."""
+    n = len(pairs)
+    mean_x = sum(x for x, _ in pairs) / n
+    mean_y = sum(y for _, y in pairs) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in pairs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    slope = sxy / sxx if sxx else 1.0
+    offset = mean_y - slope * mean_x
+    sigma = math.sqrt(sum((y - slope * x - offset) ** 2 for x, y in pairs) / max(n - 2, 1))
+    return round(slope, 3), round(offset, 1), round(sigma, 1)
+
+
+def fit_probcut(positions, max_depth=7, progress=None):
+    """Fits MPC_PARAMS from full-window searches of positions at depths 1..max_depth."""
+    from .search import _pvs  # imports this module
+
+    samples = {}  # (depth, phase) -> [(shallow score, deep score)]
+    for i, position in enumerate(positions):
+        tt = TranspositionTable(4)
+        ordering = MoveOrdering()
+        scores = [None]
+        for depth in range(1, max_depth + 1):
+            scores.append(_pvs(position.copy(), depth, -math.inf, math.inf, 1, position.side,
+                               SearchClock(time.time(), math.inf), tt, ordering, 0, False)[0])
+        phase = phase_index(position.total_discs)
+        for depth in range(MPC_MIN_DEPTH, max_depth + 1):
+            samples.setdefault((depth, phase), []).append((scores[shallow_depth(depth)], scores[depth]))
+        if progress is not None:
+            progress(i + 1, len(positions))
+
+    params = {}
+    for depth in range(MPC_MIN_DEPTH, max_depth + 1):
+        fitted = [_regress(samples[depth, phase]) if len(samples.get((depth, phase), ())) > 2 else None
+                  for phase in range(3)]
+        if None not in fitted:
+            params[depth] = tuple(fitted)
+    return params
+
+
+def _main(argv):
+    games = int(argv[1]) if len(argv) > 1 else 20
+    max_depth = int(argv[2]) if len(argv) > 2 else 7
+    start = time.time()
+    positions = self_play_positions(games)[::4]
+    params = fit_probcut(positions, max_depth,
+                         progress=lambda done, total: print(f"{done}/{total} positions", file=sys.stderr))
+    print(f"# {len(positions)} positions from {games} games, {time.time() - start:.0f}s")
+    print("MPC_PARAMS = {")
+    for depth, fitted in params.items():
+        print(f"    {depth}: {fitted},")
+    print("}")
+
+
+if __name__ == '__main__':
+    _main(sys.argv)
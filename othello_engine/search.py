@@ -0,0 +1,394 @@
+import math
+import time
+
+from .bitboard import get_flips, get_moves, iter_squares, popcount
+from .constants import ENDGAME_EMPTIES, PLAYER_BLACK, PROBCUT_THRESHOLDS, TIME_LIMITS, WLD_EMPTIES
+from .endgame import solve_endgame
+from .evaluation import evaluate_position
+from .ordering import MoveOrdering
+from .probcut import MultiProbCut
+from .symmetry import INVERSE_SQUARES, SYMMETRY_SQUARES, canonical_hash, is_symmetric
+from .timecontrol import SearchClock, SearchTimeout, next_iteration_time
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+TT_SIZE_MB = 32
+# Half-width of the first aspiration window, widened 4x on each fail
+ASPIRATION_WINDOW = 100
+# Internal iterative deepening: nodes this deep with no hash move first run
+# a search IID_REDUCTION plies shallower to find one
+IID_MIN_DEPTH = 6
+IID_REDUCTION = 2
+# Share of the move's (soft) time the endgame solver may use before the
+# heuristic search takes over; the search then still gets at least
+# MIN_SEARCH_TIME seconds
+ENDGAME_TIME_SHARE = 0.5
+MIN_SEARCH_TIME = 0.5
+# Plies beyond the Difficulty's depth that a Multi-ProbCut search may reach
+PROBCUT_EXTRA_DEPTH = 4
+
+
+def _evaluate_children_batch(position, move_scores, ai_player):
+    """Scores every child of a depth-1 node in one batch_evaluate_bitboards call."""
+    from .batch_eval import batch_evaluate_bitboards
+    player = position.side
+    own, opp = position.bitboards(player)
+    own_children = [own | flips | (1 << sq) for _, sq, flips in move_scores]
+    opp_children = [opp & ~flips for _, _, flips in move_scores]
+    if player == PLAYER_BLACK:
+        black, white = own_children, opp_children
+    else:
+        black, white = opp_children, own_children
+    return batch_evaluate_bitboards(black, white, ai_player, position.total_discs + 1).tolist()
+
+
+def _pvs(position, depth, alpha, beta, sign, ai_player, clock, tt, ordering, ply, batch_leaves, probcut=None,
+         eval_cache=None, stats=None, evaluated=None):
+    """Negamax principal variation search; returns (score, best square).
+
+    Scores are from the side to move's point of view: sign is +1 where that
+    is ai_player and -1 where it is the opponent, so leaf evaluations are
+    sign * evaluate_position(..., ai_player). The first move gets the full
+    window, the rest a null window, re-searched only if they fail high.
+    Moves are ordered by ordering (see othello_engine.ordering). probcut, a
+    MultiProbCut, enables forward pruning below the root, and leaves are
+    scored through eval_cache (an EvalCache) if there is one. stats, a
+    SearchStats, counts leaves, table hits and cutoffs. If evaluated is a
+    list, every searched move's (score, square) is added.
+    """
+    clock.check()
+    
+    own, opp = position.bitboards(position.side)
+    moves = get_moves(own, opp)
+    game_over = not moves and not get_moves(opp, own)
+
+    if depth == 0 or game_over:
+        if stats is not None:
+            stats.leaves += 1
+        if eval_cache is not None:
+            return sign * eval_cache.evaluate(position, ai_player, depth), None
+        return sign * evaluate_position(position, ai_player, depth), None
+
+    if not moves:
+        position.apply_pass()
+        score, _ = _pvs(position, depth - 1, -beta, -alpha, -sign, ai_player, clock,
+                        tt, ordering, ply + 1, batch_leaves, probcut, eval_cache, stats)
+        position.apply_pass()
+        return -score, None
+
+    # Transposition table: cut off on a deep enough bound, else seed ordering
+    if tt.symmetric:
+        key, symmetry = canonical_hash(position.black, position.white, position.side != PLAYER_BLACK)
+    else:
+        key, symmetry = position.hash, 0
+    alpha_orig, beta_orig = alpha, beta
+    tt_move = None
+    entry = tt.probe(key)
+    if stats is not None:
+        stats.tt_probes += 1
+        stats.tt_hits += entry is not None
+    if entry is not None:
+        entry_depth, flag, entry_score, tt_move = entry[1:5]
+        if symmetry and tt_move is not None:
+            tt_move = INVERSE_SQUARES[symmetry][tt_move]
+        if ply > 0 and entry_depth >= depth:
+            if flag == EXACT:
+                return entry_score, tt_move
+            if flag == LOWER_BOUND:
+                alpha = max(alpha, entry_score)
+            else:
+                beta = min(beta, entry_score)
+            if beta <= alpha:
+                return entry_score, tt_move
+
+    # Multi-ProbCut: at null-window nodes, let a shallow search predict a fail
+    if probcut is not None and ply > 0 and beta - alpha <= 1:
+        check = probcut.check(depth, position.total_discs)
+        if check is not None:
+            shallow, slope, offset, sigma = check
+            margin = probcut.threshold * sigma
+            if beta < math.inf:
+                bound = (beta + margin - offset) / slope
+                if _pvs(position, shallow, bound - 1, bound, sign, ai_player, clock,
+                        tt, ordering, ply, batch_leaves, probcut, eval_cache, stats)[0] >= bound:
+                    probcut.cuts += 1
+                    return beta, None
+            if alpha > -math.inf:
+                bound = (alpha - margin - offset) / slope
+                if _pvs(position, shallow, bound, bound + 1, sign, ai_player, clock,
+                        tt, ordering, ply, batch_leaves, probcut, eval_cache, stats)[0] <= bound:
+                    probcut.cuts += 1
+                    return alpha, None
+
+    if tt_move is None and depth >= IID_MIN_DEPTH:
+        _, tt_move = _pvs(position, depth - IID_REDUCTION, alpha, beta, sign, ai_player, clock,
+                          tt, ordering, ply, batch_leaves, probcut, eval_cache, stats)
+
+    candidates = [(sq, get_flips(own, opp, sq)) for sq in iter_squares(moves)]
+    move_scores = ordering.score_moves(candidates, position.side, ply, tt_move)
+
+    child_scores = None
+    if batch_leaves and depth == 1:
+        from .batch_eval import NUMPY_AVAILABLE  # loads NumPy, so only batch searches import it
+        if NUMPY_AVAILABLE:
+            child_scores = _evaluate_children_batch(position, move_scores, ai_player)
+
+    best_score = -math.inf
+    best_sq = move_scores[0][1]
+    for i, (_, sq, flips) in enumerate(move_scores):
+        if child_scores is not None:
+            score = sign * child_scores[i]
+        else:
+            undo = position.apply_move(sq, flips)
+            if i == 0:
+                score = -_pvs(position, depth - 1, -beta, -alpha, -sign, ai_player, clock,
+                              tt, ordering, ply + 1, batch_leaves, probcut, eval_cache, stats)[0]
+            else:
+                score = -_pvs(position, depth - 1, -alpha - 1, -alpha, -sign, ai_player, clock,
+                              tt, ordering, ply + 1, batch_leaves, probcut, eval_cache, stats)[0]
+                if alpha < score < beta:
+                    score = -_pvs(position, depth - 1, -beta, -alpha, -sign, ai_player, clock,
+                                  tt, ordering, ply + 1, batch_leaves, probcut, eval_cache, stats)[0]
+            position.undo_move(undo)
+        if evaluated is not None:
+            evaluated.append((score, sq))
+        
+        if score > best_score:
+            best_score = score
+            best_sq = sq
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    ordering.record_cutoff(sq, position.side, ply, depth)
+                    if stats is not None:
+                        stats.cutoffs += 1
+                        stats.first_move_cutoffs += i == 0
+                    break  # Alpha-beta pruning
+
+    if best_score <= alpha_orig:
+        flag = UPPER_BOUND
+    elif best_score >= beta_orig:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    tt.store(key, depth, flag, best_score, SYMMETRY_SQUARES[symmetry][best_sq])
+
+    return best_score, best_sq
+
+
+def enhanced_minimax_alphabeta(position, depth, alpha, beta, maximizing_player, ai_player, start_time, time_limit=10.0,
+                               tt=None, ply=0, batch_leaves=False, ordering=None, probcut=None, clock=None,
+                               eval_cache=None, stats=None):
+    """Alpha-beta search over a Position, playing moves on it in place.
+
+    A minimax front end to the negamax PVS core: alpha, beta and the
+    returned scores are from ai_player's point of view, with the side to
+    move maximizing if maximizing_player. Returns (score, best_move,
+    evaluated_moves) where moves are (row, col) and evaluated_moves holds
+    every root move searched, best first.
+
+    position is mutated with apply_move/undo_move and restored before
+    returning. Table scores depend on ai_player, so a transposition table
+    must not be shared between searches for different players.
+
+    With batch_leaves (and numpy installed) the children of depth-1 nodes
+    are scored together by the vectorised evaluator instead of one by one;
+    the result is identical, only the leaf cost changes. probcut (a
+    MultiProbCut) turns on selective search, see othello_engine.probcut;
+    eval_cache (an EvalCache) caches leaf evaluations and stats (a
+    SearchStats) collects counters.
+
+    Raises SearchTimeout once time_limit is exceeded, or once clock (a
+    SearchClock that replaces start_time and time_limit) is stopped; the
+    position is left mid-search in that case, so always search a copy.
+    """
+    if clock is None:
+        clock = SearchClock(start_time, time_limit)
+    if tt is None:
+        tt = TranspositionTable(TT_SIZE_MB)
+    if ordering is None:
+        ordering = MoveOrdering()
+
+    sign = 1 if maximizing_player else -1
+    if maximizing_player:
+        low, high = alpha, beta
+    else:
+        low, high = -beta, -alpha
+
+    evaluated = []
+    score, best_sq = _pvs(position, depth, low, high, sign, ai_player, clock,
+                          tt, ordering, ply, batch_leaves, probcut, eval_cache, stats, evaluated)
+
+    evaluated_moves = [(sign * move_score, divmod(sq, 8)) for move_score, sq in evaluated]
+    evaluated_moves.sort(key=lambda x: x[0], reverse=maximizing_player)
+    best_move = divmod(best_sq, 8) if best_sq is not None else None
+    return sign * score, best_move, evaluated_moves
+
+
+def iterative_deepening(position, max_depth, ai_player, start_time, time_limit, tt=None, batch_leaves=False,
+                        probcut=None, clock=None, ordering=None, soft_limit=None, eval_cache=None, stats=None):
+    """Searches depth 1, 2, ... max_depth until the clock runs out.
+
+    Each iteration leaves its principal variation in the transposition table,
+    where the next one picks it up as the first move to try at every node.
+    From depth 3 on the search starts with an aspiration window around the
+    score of the last iteration of the same parity (scores alternate between
+    odd and even depths) and widens it on a fail. Depth 1 always completes.
+    No iteration starts that is predicted to end after soft_limit (by
+    default time_limit), see othello_engine.timecontrol.
+
+    Returns (score, best_move, evaluated_moves, depth) of the deepest
+    completed iteration; a half-searched iteration is discarded. A clock
+    passed in replaces start_time, time_limit and soft_limit and lets
+    another thread stop the search. stats, a SearchStats, also gets the
+    depth reached and the node count of every iteration.
+    """
+    if clock is None:
+        clock = SearchClock(start_time, time_limit, soft_limit)
+    if tt is None:
+        tt = TranspositionTable(TT_SIZE_MB)
+    if ordering is None:
+        ordering = MoveOrdering()
+
+    if popcount(position.legal_moves()) == 1:
+        max_depth = 1  # forced move, nothing to think about
+
+    scores = []
+    iteration_times = []
+    iteration_nodes = []
+    result = None
+    for depth in range(1, max_depth + 1):
+        predicted = next_iteration_time(iteration_times, iteration_nodes)
+        if result is not None and clock.elapsed() + predicted > clock.soft_limit:
+            break  # would not finish in time: stop on the last full iteration
+        depth_clock = clock if depth > 1 else SearchClock(clock.start_time, math.inf)
+        iteration_start, nodes_before = time.time(), depth_clock.nodes
+        if len(scores) >= 2:
+            guess = scores[-2]
+            delta = ASPIRATION_WINDOW
+            alpha, beta = guess - delta, guess + delta
+        else:
+            alpha, beta = -math.inf, math.inf
+        try:
+            while True:
+                score, best_move, evaluated_moves = enhanced_minimax_alphabeta(
+                    position.copy(), depth, alpha, beta, True, ai_player,
+                    clock.start_time, clock.time_limit, tt, batch_leaves=batch_leaves, ordering=ordering,
+                    probcut=probcut, clock=depth_clock, eval_cache=eval_cache, stats=stats
+                )
+                if score <= alpha:
+                    delta *= 4
+                    alpha = guess - delta if delta < 10 * ASPIRATION_WINDOW else -math.inf
+                elif score >= beta:
+                    delta *= 4
+                    beta = guess + delta if delta < 10 * ASPIRATION_WINDOW else math.inf
+                else:
+                    break
+        except SearchTimeout:
+            if stats is not None:
+                stats.nodes += depth_clock.nodes - nodes_before
+            break
+        scores.append(score)
+        iteration_times.append(time.time() - iteration_start)
+        iteration_nodes.append(depth_clock.nodes - nodes_before)
+        result = (score, best_move, evaluated_moves, depth)
+        if stats is not None:
+            stats.nodes += iteration_nodes[-1]
+            stats.iteration_nodes.append(iteration_nodes[-1])
+            stats.depth = depth
+
+    return result
+
+
+def search_settings(difficulty):
+    """(max_depth, probcut) of a heuristic search at the given Difficulty.
+
+    Difficulties with a PROBCUT_THRESHOLDS entry search selectively, with a
+    fresh MultiProbCut, PROBCUT_EXTRA_DEPTH plies deeper; probcut is None
+    for the others.
+    """
+    threshold = PROBCUT_THRESHOLDS[difficulty]
+    if threshold is None:
+        return difficulty.value, None
+    return difficulty.value + PROBCUT_EXTRA_DEPTH, MultiProbCut(threshold)
+
+
+def choose_move(game, difficulty, time_limit=None, batch_leaves=False, workers=1, tt=None, ordering=None,
+                time_manager=None, eval_cache=None, stats=None):
+    """Searches game's position at the given Difficulty without touching game.
+
+    Within WLD_EMPTIES / ENDGAME_EMPTIES of the end the endgame solver is
+    tried first. With workers > 1 the root moves are searched in that many
+    processes (see othello_engine.parallel). The depth and selectivity of
+    the search come from search_settings(difficulty). tt and ordering, if given, carry over the state of an earlier
+    search for the same player (see othello_engine.engine); eval_cache, an
+    EvalCache, is used for leaf evaluations. stats, a SearchStats, is
+    filled in for the move.
+
+    Without a time_limit the move gets TIME_LIMITS[difficulty], or, with a
+    time_manager (a TimeManager for game.current_player), its share of the
+    game budget, which is charged with the time used. Returns (best_move,
+    evaluated_moves) with moves as (row, col).
+    """
+    start_time = time.time()
+    if stats is not None and eval_cache is not None:
+        cache_hits, cache_misses = eval_cache.hits, eval_cache.misses
+    try:
+        return _choose_move(game, difficulty, start_time, time_limit, batch_leaves, workers, tt, ordering,
+                            time_manager, eval_cache, stats)
+    finally:
+        elapsed = time.time() - start_time
+        if time_manager is not None:
+            time_manager.record(elapsed)
+        if stats is not None:
+            stats.elapsed = elapsed
+            if eval_cache is not None:
+                stats.eval_cache_hits = eval_cache.hits - cache_hits
+                stats.eval_cache_misses = eval_cache.misses - cache_misses
+
+
+def _choose_move(game, difficulty, start_time, time_limit, batch_leaves, workers, tt, ordering, time_manager,
+                 eval_cache, stats):
+    if time_limit is None and time_manager is not None:
+        soft_limit, time_limit = time_manager.allocate(game.position.empties)
+    elif time_limit is None:
+        soft_limit = time_limit = TIME_LIMITS[difficulty]
+    else:
+        soft_limit = time_limit
+
+    empties = game.position.empties
+    if empties <= WLD_EMPTIES[difficulty]:
+        try:
+            _, best_move, evaluated_moves = solve_endgame(game.position, start_time, soft_limit * ENDGAME_TIME_SHARE,
+                                                          exact=empties <= ENDGAME_EMPTIES[difficulty])
+            if stats is not None:
+                stats.source, stats.depth = 'endgame', empties
+            return best_move, evaluated_moves
+        except SearchTimeout:
+            pass  # not solved in time, fall back to the heuristic search
+        # The search gets the soft time the solver did not use, up to the
+        # hard limit, and never less than MIN_SEARCH_TIME
+        solver_time = time.time() - start_time
+        time_limit = max(time_limit, solver_time + MIN_SEARCH_TIME)
+        soft_limit = min(max(soft_limit + solver_time, solver_time + MIN_SEARCH_TIME), time_limit)
+
+    if workers > 1:
+        from .parallel import get_parallel_search  # imports this module
+        _, best_move, evaluated_moves, depth = get_parallel_search(workers).search(
+            game.position, difficulty.value, game.current_player, start_time, time_limit
+        )
+        if stats is not None:
+            stats.source, stats.depth = 'parallel', depth
+        return best_move, evaluated_moves
+
+    # Symmetric keys only pay off below a symmetric root, where mirrored lines meet
+    position = game.position
+    if tt is None:
+        tt = TranspositionTable(TT_SIZE_MB, symmetric=is_symmetric(position.black, position.white))
+    max_depth, probcut = search_settings(difficulty)
+    _, best_move, evaluated_moves, _ = iterative_deepening(
+        position, max_depth, game.current_player, start_time, time_limit, tt, batch_leaves, probcut,
+        ordering=ordering, soft_limit=soft_limit, eval_cache=eval_cache, stats=stats
+    )
+    if stats is not None and probcut is not None:
+        stats.probcut_cuts = probcut.cuts
+    return best_move, evaluated_moves
@@ -0,0 +1,209 @@
+"""The AI as a long-lived service next to the UI.
+
+The engines of both AI sides live in one worker process, so a search uses
+a full core without sharing the GIL with the rendering loop. The UI talks
+to it through two queues: requests carry position snapshots, and results
+come back tagged with the id of the request they answer. The UI polls for
+them once a frame. Engines, opening book and time managers stay warm in the
+worker from one move to the next; new_game() resets them.
+
+Where processes cannot be started, the same loop runs in a thread of the
+UI process instead.
+"""
+
+import atexit
+import multiprocessing
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from .book import load_default_book
+from .constants import GAME_TIME_BUDGETS, PLAYER_BLACK, PLAYER_WHITE
+from .engine import Engine
+from .timecontrol import TimeManager
+
+# Seconds to wait for the worker to exit before killing it
+SHUTDOWN_TIMEOUT = 2.0
+
+AIResult = namedtuple('AIResult', 'best_move evaluated_moves think_time stats error')
+
+
+# =============================================================================
+# 1. Worker Side
+# =============================================================================
+
+class _Snapshot:
+    """The parts of an Othello game that Engine reads."""
+
+    __slots__ = ('position',)
+
+    def __init__(self, position):
+        self.position = position
+
+    @property
+    def current_player(self):
+        return self.position.side
+
+
+def _serve(requests, results, use_book):
+    """Worker loop: answers requests until it gets None.
+
+    Requests are ('move', id, position, difficulty, workers, min_time),
+    ('ponder', position, difficulty), ('stop',) and ('new_game',).
+    Moves are answered with ('move', id, best_move, evaluated_moves,
+    think_time, stats) or ('error', id, message), where stats is the
+    search's SearchStats.as_record() or None.
+    """
+    book = load_default_book() if use_book else None
+    engines = {player: Engine(book) for player in (PLAYER_BLACK, PLAYER_WHITE)}
+    time_managers = {}
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        kind = request[0]
+        if kind == 'move':
+            _, request_id, position, difficulty, workers, min_time = request
+            start_time = time.time()
+            time_manager = time_managers.setdefault(position.side, TimeManager(GAME_TIME_BUDGETS[difficulty]))
+            try:
+                best_move, evaluated_moves = engines[position.side].choose_move(
+                    _Snapshot(position), difficulty, workers=workers, time_manager=time_manager)
+            except Exception as e:
+                results.put(('error', request_id, f"{type(e).__name__}: {e}"))
+                continue
+            think_time = time.time() - start_time
+            stats = engines[position.side].last_stats
+            if think_time < min_time:
+                time.sleep(min_time - think_time)
+            results.put(('move', request_id, best_move, evaluated_moves, think_time,
+                         stats.as_record() if stats is not None else None))
+        elif kind == 'ponder':
+            _, position, difficulty = request
+            engines[-position.side].ponder(_Snapshot(position), difficulty)
+        elif kind == 'stop':
+            for engine in engines.values():
+                engine.ponderer.stop()
+        elif kind == 'new_game':
+            for engine in engines.values():
+                engine.new_game()
+            time_managers.clear()
+    for engine in engines.values():
+        engine.ponderer.stop()
+
+
+# =============================================================================
+# 2. UI Side
+# =============================================================================
+
+class AIService:
+    """Handle on the AI worker: send requests, poll for results.
+
+    Workers are started with the ``spawn`` method, as in
+    othello_engine.parallel, and are not daemons so that AI_WORKERS > 1
+    can still start its own pool inside them; close() (also run at exit)
+    shuts the worker down.
+    """
+
+    def __init__(self, use_process=True, use_book=True):
+        self.use_process = use_process
+        self.use_book = use_book
+        self.busy = False  # a move request is outstanding
+        self.requests = None
+        self.results = None
+        self._worker = None
+        self._request_id = 0
+        self._pondering = None  # (position, difficulty) last sent to ponder
+        self.start()
+        atexit.register(self.close)
+
+    def start(self):
+        if self.use_process:
+            try:
+                context = multiprocessing.get_context('spawn')
+                self.requests, self.results = context.Queue(), context.Queue()
+                self._worker = context.Process(target=_serve, args=(self.requests, self.results, self.use_book),
+                                               name='othello-ai')
+                self._worker.start()
+                return
+            except (OSError, ImportError, ValueError):
+                self.use_process = False  # no working multiprocessing here
+        self.requests, self.results = queue.Queue(), queue.Queue()
+        self._worker = threading.Thread(target=_serve, args=(self.requests, self.results, self.use_book),
+                                        name='othello-ai', daemon=True)
+        self._worker.start()
+
+    def close(self):
+        """Stops the worker; a terminated search is simply lost."""
+        if self._worker is None:
+            return
+        self.requests.put(None)
+        self._worker.join(SHUTDOWN_TIMEOUT)
+        if self.use_process:
+            if self._worker.is_alive():
+                self._worker.terminate()
+                self._worker.join()
+            self.requests.close()
+            self.results.close()
+        self._worker = None
+        self.busy = False
+        self._pondering = None
+
+    def restart(self):
+        """Replaces the worker with a fresh one, abandoning any search in progress."""
+        if self.use_process and self._worker is not None:
+            self._worker.terminate()
+            self._worker.join()
+            self.requests.close()
+            self.results.close()
+            self._worker = None
+        else:
+            self.close()
+        self.busy = False
+        self._pondering = None
+        self.start()
+
+    def request_move(self, position, difficulty, workers=1, min_time=0.0):
+        """Asks for a move for position's side to move; the answer comes from poll()."""
+        self._request_id += 1
+        self._pondering = None  # choose_move takes over whatever was pondered
+        self.busy = True
+        self.requests.put(('move', self._request_id, position.copy(), difficulty, workers, min_time))
+
+    def poll(self):
+        """The AIResult of the outstanding move request if it is ready, else None."""
+        while True:
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                return None
+            if result[1] != self._request_id:
+                continue  # answer to a request from an abandoned game
+            self.busy = False
+            if result[0] == 'error':
+                return AIResult(None, [], 0.0, None, result[2])
+            _, _, best_move, evaluated_moves, think_time, stats = result
+            return AIResult(best_move, evaluated_moves, think_time, stats, None)
+
+    def ponder(self, position, difficulty):
+        """Keeps the opponent of position's side to move searching; cheap to call every frame."""
+        if self._pondering is not None and self._pondering == (position, difficulty):
+            return
+        self._pondering = (position.copy(), difficulty)
+        self.requests.put(('ponder', position.copy(), difficulty))
+
+    def stop_pondering(self):
+        if self._pondering is not None:
+            self._pondering = None
+            self.requests.put(('stop',))
+
+    def new_game(self):
+        """Resets the engines for a new game; a busy process worker is restarted instead."""
+        self._request_id += 1
+        if self.busy and self.use_process:
+            self.restart()
+            return
+        self.busy = False
+        self._pondering = None
+        self.requests.put(('new_game',))
@@ -0,0 +1,88 @@
+"""Stable discs: discs that can never be flipped again.
+
+A disc is stable when, along each of the four axes (row, column and both
+diagonals), it cannot be outflanked: either the whole line through it on
+that axis is filled, or one of its two neighbours on that axis is the
+board edge or another stable disc of the same colour. Starting from no
+stable discs and applying the rule until nothing changes gives the set of
+discs this rule proves stable, corners first and spreading inwards.
+
+The fast mode skips the filled-line test and only grows stability out from
+the edges. It finds a subset of the exact set.
+"""
+
+from .bitboard import NOT_COL0, NOT_COL7, popcount
+from .geometry import BORDER_MASK, NORTH_SOUTH_BORDER, WEST_EAST_BORDER
+
+_COL0 = 0x0101010101010101
+_ROW0 = 0xFF
+
+
+def full_lines(occupied):
+    """Masks of squares whose row, column, diagonal and anti-diagonal are filled.
+
+    Each line is checked from both ends by doubling shifts; squares whose
+    line ends within the shift distance are let through by the constant.
+    """
+    rows = occupied & (occupied >> 1)
+    rows &= rows >> 2
+    rows &= rows >> 4
+    full_rows = (rows & _COL0) * _ROW0  # each full row's column-0 bit, spread over the row
+
+    columns = occupied & (occupied >> 8)
+    columns &= columns >> 16
+    columns &= columns >> 32
+    full_columns = (columns & _ROW0) * _COL0
+
+    # Diagonal: towards h8 (>> 9) and towards a1 (<< 9)
+    down = occupied & ((occupied >> 9) | 0xFF80808080808080)
+    down &= (down >> 18) | 0xFFFFC0C0C0C0C0C0
+    down &= (down >> 36) | 0xFFFFFFFFF0F0F0F0
+    up = occupied & ((occupied << 9) | 0x01010101010101FF)
+    up &= (up << 18) | 0x030303030303FFFF
+    up &= (up << 36) | 0x0F0F0F0FFFFFFFFF
+    full_diagonals = down & up
+
+    # Anti-diagonal: towards a8 (>> 7) and towards h1 (<< 7)
+    down = occupied & ((occupied >> 7) | 0xFF01010101010101)
+    down &= (down >> 14) | 0xFFFF030303030303
+    down &= (down >> 28) | 0xFFFFFFFF0F0F0F0F
+    up = occupied & ((occupied << 7) | 0x80808080808080FF)
+    up &= (up << 14) | 0xC0C0C0C0C0C0FFFF
+    up &= (up << 28) | 0xF0F0F0F0FFFFFFFF
+    full_anti_diagonals = down & up
+
+    return full_rows, full_columns, full_diagonals, full_anti_diagonals
+
+
+def _grow_stable(own, horizontal, vertical, diagonal, anti_diagonal):
+    stable = 0
+    while True:
+        grown = (own
+                 & (horizontal | ((stable << 1) & NOT_COL0) | ((stable >> 1) & NOT_COL7))
+                 & (vertical | (stable << 8) | (stable >> 8))
+                 & (diagonal | ((stable << 9) & NOT_COL0) | ((stable >> 9) & NOT_COL7))
+                 & (anti_diagonal | ((stable << 7) & NOT_COL7) | ((stable >> 7) & NOT_COL0)))
+        if grown == stable:
+            return stable
+        stable = grown
+
+
+def _axis_masks(own, opp, exact):
+    """Per axis, the squares that cannot be outflanked on it whatever their neighbours."""
+    if not exact:
+        return WEST_EAST_BORDER, NORTH_SOUTH_BORDER, BORDER_MASK, BORDER_MASK
+    full_rows, full_columns, full_diagonals, full_anti_diagonals = full_lines(own | opp)
+    return (WEST_EAST_BORDER | full_rows, NORTH_SOUTH_BORDER | full_columns,
+            BORDER_MASK | full_diagonals, BORDER_MASK | full_anti_diagonals)
+
+
+def stable_discs(own, opp, exact=True):
+    """Mask of own's stable discs; exact=False is the faster edge-only mode."""
+    return _grow_stable(own, *_axis_masks(own, opp, exact))
+
+
+def stable_disc_counts(own, opp, exact=True):
+    """(own, opp) stable disc counts, sharing the filled-line masks."""
+    axes = _axis_masks(own, opp, exact)
+    return popcount(_grow_stable(own, *axes)), popcount(_grow_stable(opp, *axes))
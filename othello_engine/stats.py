@@ -0,0 +1,89 @@
+"""Search statistics, one SearchStats per move.
+
+The search core only bumps a few integer counters on events that are
+already branches (leaves, table hits, cutoffs); node counts come from the
+SearchClock, and iteration sizes from iterative deepening, for free. Every
+counter sits behind an `is not None` test, so a search without a
+SearchStats pays nothing else. Setting OTHELLO_STATS=0 in the environment
+turns collection off for Engine searches, for benchmarks.
+
+as_record() gives a flat dict per move, for the AI panel and for
+log_record(), which appends it to a JSON-lines file.
+"""
+
+import json
+import math
+import os
+
+STATS_ENABLED = os.environ.get('OTHELLO_STATS', '1') != '0'
+
+
+class SearchStats:
+    """Counters of one move's search."""
+
+    __slots__ = ('source', 'nodes', 'leaves', 'tt_probes', 'tt_hits', 'cutoffs', 'first_move_cutoffs',
+                 'probcut_cuts', 'depth', 'iteration_nodes', 'elapsed', 'eval_cache_hits', 'eval_cache_misses')
+
+    def __init__(self):
+        self.source = 'search'  # or 'book', 'ponder', 'endgame', 'parallel'
+        self.nodes = 0
+        self.leaves = 0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.probcut_cuts = 0
+        self.depth = 0
+        self.iteration_nodes = []
+        self.elapsed = 0.0
+        self.eval_cache_hits = 0
+        self.eval_cache_misses = 0
+
+    @property
+    def nps(self):
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def branching_factor(self):
+        """Effective branching factor: geometric mean growth of the iterations from depth 2 on."""
+        sizes = self.iteration_nodes[1:]
+        if len(sizes) < 2 or not sizes[0]:
+            return 0.0
+        return math.exp(math.log(sizes[-1] / sizes[0]) / (len(sizes) - 1))
+
+    @property
+    def first_move_cutoff_rate(self):
+        """Share of cutoffs made by the first move tried: move ordering quality."""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    @property
+    def tt_hit_rate(self):
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    @property
+    def eval_cache_hit_rate(self):
+        lookups = self.eval_cache_hits + self.eval_cache_misses
+        return self.eval_cache_hits / lookups if lookups else 0.0
+
+    def as_record(self):
+        return {
+            'source': self.source,
+            'depth': self.depth,
+            'nodes': self.nodes,
+            'leaves': self.leaves,
+            'elapsed': round(self.elapsed, 4),
+            'nps': round(self.nps),
+            'branching_factor': round(self.branching_factor, 2),
+            'cutoffs': self.cutoffs,
+            'first_move_cutoff_rate': round(self.first_move_cutoff_rate, 3),
+            'tt_hit_rate': round(self.tt_hit_rate, 3),
+            'eval_cache_hit_rate': round(self.eval_cache_hit_rate, 3),
+            'probcut_cuts': self.probcut_cuts,
+            'iteration_nodes': list(self.iteration_nodes),
+        }
+
+
+def log_record(path, record):
+    """Appends record as one JSON line to the file at path."""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
@@ -0,0 +1,100 @@
+"""The 8 symmetries of the board (rotations and reflections) on bitboards.
+
+Symmetry s applies, in this order, a left-right mirror if s & 1, an
+up-down flip if s & 2 and a transpose (r, c) -> (c, r) if s & 4; 0 is the
+identity. The canonical form of a position is its image with the smallest
+(black, white) pair, so positions that are rotations or reflections of
+each other share one canonical form and one canonical hash. Moves found in
+the canonical frame are translated back with INVERSE_SQUARES.
+"""
+
+from .transposition import ZOBRIST_BLACK, ZOBRIST_SIDE, ZOBRIST_WHITE
+
+_K1 = 0x5555555555555555
+_K2 = 0x3333333333333333
+_K4 = 0x0F0F0F0F0F0F0F0F
+
+
+def mirror_horizontal(mask):
+    """(r, c) -> (r, 7 - c): reverses the bits of every row byte."""
+    mask = ((mask >> 1) & _K1) | ((mask & _K1) << 1)
+    mask = ((mask >> 2) & _K2) | ((mask & _K2) << 2)
+    return ((mask >> 4) & _K4) | ((mask & _K4) << 4)
+
+
+def flip_vertical(mask):
+    """(r, c) -> (7 - r, c): reverses the row bytes."""
+    return int.from_bytes(mask.to_bytes(8, 'little'), 'big')
+
+
+def transpose(mask):
+    """(r, c) -> (c, r), by three delta swaps."""
+    t = 0x0F0F0F0F00000000 & (mask ^ (mask << 28))
+    mask ^= t ^ (t >> 28)
+    t = 0x3333000033330000 & (mask ^ (mask << 14))
+    mask ^= t ^ (t >> 14)
+    t = 0x5500550055005500 & (mask ^ (mask << 7))
+    return mask ^ t ^ (t >> 7)
+
+
+def transform(mask, symmetry):
+    if symmetry & 1:
+        mask = mirror_horizontal(mask)
+    if symmetry & 2:
+        mask = flip_vertical(mask)
+    if symmetry & 4:
+        mask = transpose(mask)
+    return mask
+
+
+# SYMMETRY_SQUARES[s][sq]: where symmetry s sends sq; INVERSE_SQUARES[s] undoes it
+SYMMETRY_SQUARES = tuple(tuple(transform(1 << sq, s).bit_length() - 1 for sq in range(64)) for s in range(8))
+INVERSE_SQUARES = tuple(tuple(squares.index(sq) for sq in range(64)) for squares in SYMMETRY_SQUARES)
+
+
+def _byte_keys(square_keys):
+    tables = []
+    for row in range(8):
+        table = [0] * 256
+        for value in range(1, 256):
+            low = value & -value
+            table[value] = table[value ^ low] ^ square_keys[row * 8 + low.bit_length() - 1]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+# Zobrist keys per (row, row byte), so hashing a board is 16 lookups
+_BYTE_KEYS_BLACK = _byte_keys(ZOBRIST_BLACK)
+_BYTE_KEYS_WHITE = _byte_keys(ZOBRIST_WHITE)
+
+
+def board_hash(black, white, white_to_move):
+    """The Zobrist hash of compute_hash, by row bytes."""
+    key = ZOBRIST_SIDE if white_to_move else 0
+    for row in range(8):
+        shift = row * 8
+        key ^= _BYTE_KEYS_BLACK[row][black >> shift & 0xFF] ^ _BYTE_KEYS_WHITE[row][white >> shift & 0xFF]
+    return key
+
+
+def canonical(black, white):
+    """Returns (black, white, symmetry) with the smallest (black, white) image."""
+    images = [(black, white), (mirror_horizontal(black), mirror_horizontal(white))]
+    images += [(flip_vertical(b), flip_vertical(w)) for b, w in images]
+    best = (black, white, 0)
+    for symmetry, (b, w) in enumerate(images):
+        for image in ((b, w, symmetry), (transpose(b), transpose(w), symmetry | 4)):
+            if image < best:
+                best = image
+    return best
+
+
+def canonical_hash(black, white, white_to_move):
+    """(hash of the canonical form, symmetry that maps the position onto it)."""
+    black, white, symmetry = canonical(black, white)
+    return board_hash(black, white, white_to_move), symmetry
+
+
+def is_symmetric(black, white):
+    """True if some symmetry other than the identity maps the position onto itself."""
+    return any(transform(black, s) == black and transform(white, s) == white for s in range(1, 8))
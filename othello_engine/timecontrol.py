@@ -0,0 +1,113 @@
+"""Search clock handling and time management.
+
+A SearchClock is the time limit of one search. The search calls check() at
+every node, which only reads the system clock every POLL_INTERVAL nodes.
+Besides the hard limit, after which the search is aborted mid-iteration,
+the clock has a soft limit: iterative deepening does not start an iteration
+that next_iteration_time predicts to end after it, so a move normally ends
+cleanly on a finished iteration.
+
+A TimeManager shares one player's thinking time for a whole game out over
+its moves, giving the middle game the largest share.
+"""
+
+import math
+import time
+
+# Nodes between two reads of the system clock
+POLL_INTERVAL = 256
+
+# Move weights by phase (see move_weight)
+OPENING_EMPTIES = 44
+ENDGAME_EMPTIES = 16
+MIDGAME_WEIGHT = 2.0
+# The hard limit of a move: this many times its share, at most this share
+# of what is left
+HARD_LIMIT_FACTOR = 3.0
+MAX_REMAINING_SHARE = 0.25
+MIN_MOVE_TIME = 0.1
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time limit runs out."""
+
+
+class SearchClock:
+    """Time limits of one search, which another thread may also stop early."""
+
+    __slots__ = ('start_time', 'time_limit', 'soft_limit', 'stopped', 'nodes', '_next_poll')
+
+    def __init__(self, start_time, time_limit, soft_limit=None):
+        self.start_time = start_time
+        self.time_limit = time_limit
+        self.soft_limit = time_limit if soft_limit is None else soft_limit
+        self.stopped = False
+        self.nodes = 0
+        self._next_poll = POLL_INTERVAL
+
+    def stop(self):
+        self.stopped = True
+
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def check(self):
+        """Counts a node; raises SearchTimeout once the time is up or stop() was called."""
+        self.nodes += 1
+        if self.nodes >= self._next_poll:
+            self._next_poll = self.nodes + POLL_INTERVAL
+            if self.stopped or time.time() - self.start_time > self.time_limit:
+                raise SearchTimeout
+
+
+def next_iteration_time(times, nodes):
+    """Predicted time of the next iteration from the effective branching factor so far.
+
+    times and nodes are per finished iteration. Scores, and tree sizes,
+    alternate between odd and even depths, so the factor is taken over the
+    last two iterations where there are enough.
+    """
+    if len(nodes) >= 3:
+        branching = math.sqrt(nodes[-1] / max(nodes[-3], 1))
+    elif len(nodes) == 2:
+        branching = nodes[-1] / max(nodes[-2], 1)
+    else:
+        return 0.0
+    return times[-1] * branching
+
+
+# =============================================================================
+# Per-game Budget
+# =============================================================================
+
+def move_weight(empties):
+    """Relative thinking time of a move: the middle game gets the most."""
+    if ENDGAME_EMPTIES < empties <= OPENING_EMPTIES:
+        return MIDGAME_WEIGHT
+    return 1.0
+
+
+class TimeManager:
+    """One player's thinking time for a game, shared out over its moves."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.used = 0.0
+
+    @property
+    def remaining(self):
+        return max(self.budget - self.used, 0.0)
+
+    def allocate(self, empties):
+        """(soft, hard) time limits in seconds for a move with empties empty squares.
+
+        The player moves on every other ply, so its later moves are taken
+        to come at empties - 2, empties - 4, ...
+        """
+        weights = [move_weight(left) for left in range(empties, 0, -2)]
+        soft = self.remaining * weights[0] / sum(weights)
+        hard = min(soft * HARD_LIMIT_FACTOR, self.remaining * MAX_REMAINING_SHARE)
+        return max(soft, MIN_MOVE_TIME), max(hard, soft, MIN_MOVE_TIME)
+
+    def record(self, elapsed):
+        self.used += elapsed
@@ -0,0 +1,100 @@
+"""Zobrist hashing and a fixed-size transposition table for the search."""
+
+import random
+
+# =============================================================================
+# 1. Zobrist Keys
+# =============================================================================
+
+_rng = random.Random(0x07E110)
+
+# One key per square for each colour, plus one for "white to move".
+ZOBRIST_BLACK = tuple(_rng.getrandbits(64) for _ in range(64))
+ZOBRIST_WHITE = tuple(_rng.getrandbits(64) for _ in range(64))
+# A flipped disc changes colour, so it toggles both of its square keys.
+ZOBRIST_FLIP = tuple(b ^ w for b, w in zip(ZOBRIST_BLACK, ZOBRIST_WHITE))
+ZOBRIST_SIDE = _rng.getrandbits(64)
+
+
+def compute_hash(black_bits, white_bits, white_to_move):
+    """Full hash from scratch; the game keeps it up to date incrementally."""
+    key = ZOBRIST_SIDE if white_to_move else 0
+    for sq in range(64):
+        bit = 1 << sq
+        if black_bits & bit:
+            key ^= ZOBRIST_BLACK[sq]
+        elif white_bits & bit:
+            key ^= ZOBRIST_WHITE[sq]
+    return key
+
+
+# =============================================================================
+# 2. Transposition Table
+# =============================================================================
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Rough CPython footprint of one stored entry tuple plus its ints.
+ENTRY_BYTES = 128
+
+
+class TranspositionTable:
+    """Fixed-size table of two-slot buckets.
+
+    Each bucket holds a depth-preferred slot, only overwritten by an equal or
+    deeper search of any position (or any search of the same position), and
+    an always-replace slot that takes everything the first slot turns away.
+    Entries are (key, depth, flag, score, move, generation) tuples, move
+    being a square index or None. new_search() starts a new generation:
+    entries from earlier searches can still be probed, but no longer hold
+    on to the depth-preferred slot, so a table can be kept for a whole game
+    and age instead of being cleared between moves.
+
+    With symmetric=True the search keys positions by their canonical hash
+    and stores moves in the canonical frame (see othello_engine.symmetry),
+    so rotations and reflections of a position share one entry.
+    """
+
+    def __init__(self, size_mb=32, symmetric=False):
+        buckets = 1
+        while buckets * 2 * 2 * ENTRY_BYTES <= size_mb * 1024 * 1024:
+            buckets *= 2
+        self.size_mb = size_mb
+        self.symmetric = symmetric
+        self.mask = buckets - 1
+        self.generation = 0
+        self.depth_slots = [None] * buckets
+        self.always_slots = [None] * buckets
+
+    def __len__(self):
+        return len(self.depth_slots) * 2
+
+    def clear(self):
+        buckets = len(self.depth_slots)
+        self.depth_slots = [None] * buckets
+        self.always_slots = [None] * buckets
+        self.generation = 0
+
+    def new_search(self):
+        self.generation += 1
+
+    def probe(self, key):
+        index = key & self.mask
+        entry = self.depth_slots[index]
+        if entry is not None and entry[0] == key:
+            return entry
+        entry = self.always_slots[index]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        index = key & self.mask
+        entry = (key, depth, flag, score, move, self.generation)
+        current = self.depth_slots[index]
+        if current is None or current[0] == key or depth >= current[1] or current[5] != self.generation:
+            self.depth_slots[index] = entry
+        else:
+            self.always_slots[index] = entry